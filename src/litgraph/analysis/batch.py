@@ -1,14 +1,22 @@
-"""Batch paper analysis — sequential loop with progress bar."""
+"""Batch paper analysis — thread pool over analyze_paper with progress bar.
+
+PDF text extraction is CPU-bound and pymupdf is not safe to use from several
+threads at once, so batches with several PDFs also start a small process pool
+that the analysis threads hand extraction off to.
+"""
 
 from __future__ import annotations
 
-import json
 import logging
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from pathlib import Path
 
-from tqdm import tqdm
-
-from litgraph.analysis.paper import analyze_paper
+from litgraph.analysis.paper import analyze_paper, safe_paper_id
+from litgraph.search.dedup import load_index
 
 logger = logging.getLogger(__name__)
 
@@ -17,41 +25,89 @@ def analyze_batch(
     paper_ids: list[str] | None = None,
     all_pending: bool = False,
     data_dir: Path = None,
+    max_workers: int | None = None,
 ) -> dict:
-    """Analyze multiple papers sequentially.
+    """Analyze multiple papers concurrently.
+
+    Per-paper time is dominated by the PDF download and the LLM call, so papers
+    are dispatched to a thread pool. Stats are only updated on the calling thread.
 
     Args:
         paper_ids: Specific paper IDs to analyze.
         all_pending: If True, analyze all papers in index that lack analysis.
         data_dir: DATA directory path.
+        max_workers: Thread pool size. Defaults to settings.analyze_workers.
 
     Returns:
         Dict with {analyzed, skipped, failed, errors}.
     """
+    from tqdm import tqdm
+
     from litgraph.settings import get_settings
+    settings = get_settings()
     if data_dir is None:
-        data_dir = get_settings().data_dir
+        data_dir = settings.data_dir
+    if max_workers is None:
+        max_workers = settings.analyze_workers
 
     papers = _resolve_papers(paper_ids, all_pending, data_dir)
 
     stats = {"analyzed": 0, "skipped": 0, "failed": 0, "errors": []}
-
-    for paper in tqdm(papers, desc="Analyzing papers"):
-        try:
-            result = analyze_paper(paper, data_dir)
-            if result is not None:
-                stats["analyzed"] += 1
-            else:
+    if not papers:
+        return stats
+
+    workers = max(1, min(max_workers, len(papers)))
+    with _pdf_pool(papers, workers) as pdf_executor, ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(analyze_paper, paper, data_dir, pdf_executor=pdf_executor): paper
+            for paper in papers
+        }
+        progress = tqdm(
+            as_completed(futures),
+            total=len(futures),
+            desc="Analyzing papers",
+            disable=not sys.stderr.isatty(),  # no redraws when stderr is piped to a log
+            mininterval=1.0,
+            smoothing=0,
+        )
+        for future in progress:
+            paper = futures[future]
+            try:
+                result = future.result()
+                if result is not None:
+                    stats["analyzed"] += 1
+                else:
+                    stats["failed"] += 1
+            except Exception as e:
+                pid = paper.get("paper_id", "unknown")
+                logger.error("Analysis failed for %s: %s", pid, e)
                 stats["failed"] += 1
-        except Exception as e:
-            pid = paper.get("paper_id", "unknown")
-            logger.error("Analysis failed for %s: %s", pid, e)
-            stats["failed"] += 1
-            stats["errors"].append({"paper_id": pid, "error": str(e)})
+                stats["errors"].append({"paper_id": pid, "error": str(e)})
 
     return stats
 
 
+def _pdf_pool(papers: list[dict], workers: int):
+    """Process pool for PDF extraction, or a null context when it would not pay off.
+
+    Spawned (not forked) since the parent already runs threads.
+    """
+    pdf_count = sum(1 for p in papers if p.get("pdf_url"))
+    if workers < 2 or pdf_count < 2:
+        return nullcontext()
+    processes = max(1, min(os.cpu_count() or 1, workers, pdf_count))
+    return ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _analyzed_ids(analysis_dir: Path) -> set[str]:
+    """Safe ids with an analysis Markdown in analysis_dir (names only, no per-entry stat)."""
+    try:
+        with os.scandir(analysis_dir) as entries:
+            return {e.name[:-3] for e in entries if e.name.endswith(".md")}
+    except FileNotFoundError:
+        return set()
+
+
 def _resolve_papers(
     paper_ids: list[str] | None,
     all_pending: bool,
@@ -63,22 +119,18 @@ def _resolve_papers(
         logger.warning("No index.json found at %s", index_path)
         return []
 
-    with open(index_path) as f:
-        all_papers = json.load(f)
+    all_papers = load_index(index_path)
 
     if paper_ids:
-        return [p for p in all_papers if p.get("paper_id") in paper_ids or p.get("dedup_key") in paper_ids]
+        wanted = set(paper_ids)
+        return [p for p in all_papers if p.get("paper_id") in wanted or p.get("dedup_key") in wanted]
 
     if all_pending:
-        # Return papers that don't have analysis files yet
-        analysis_dir = data_dir / "analysis"
-        pending = []
-        for p in all_papers:
-            pid = p.get("paper_id") or p.get("dedup_key", "unknown")
-            safe_id = pid.replace(":", "_").replace("/", "_")
-            md_path = analysis_dir / f"{safe_id}.md"
-            if not md_path.exists():
-                pending.append(p)
-        return pending
+        # Return papers that don't have analysis files yet (one directory scan, no per-paper stat)
+        existing = _analyzed_ids(data_dir / "analysis")
+        return [
+            p for p in all_papers
+            if safe_paper_id(p.get("paper_id") or p.get("dedup_key", "unknown")) not in existing
+        ]
 
     return all_papers
@@ -5,6 +5,8 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
+from litgraph.analysis.paper import list_analysis_files, list_recent_analysis_files
+from litgraph.llm.cache import ResponseCache
 from litgraph.llm.client import complete
 from litgraph.llm.prompts import load_prompt
 from litgraph.settings import get_settings
@@ -39,8 +41,13 @@ def identify_innovations(scope: str = "all", data_dir: Path | None = None) -> st
         scope=scope,
     )
 
-    # Call LLM
-    response = complete(user_prompt, system_prompt=system_prompt, model="best")
+    # Call LLM, reusing a cached report when KG context and analyses are unchanged
+    cache = ResponseCache(data_dir / "llm_cache")
+    cache_key = cache.key(get_settings().llm.best_model, system_prompt, user_prompt)
+    response = cache.get(cache_key)
+    if response is None:
+        response = complete(user_prompt, system_prompt=system_prompt, model="best")
+        cache.set(cache_key, response)
     return response
 
 
@@ -50,13 +57,11 @@ def _gather_analyses(scope: str, data_dir: Path) -> str:
     if not analysis_dir.exists():
         return "(No paper analyses available)"
 
-    md_files = sorted(analysis_dir.glob("*.md"))
-    # Exclude versioned backups
-    md_files = [f for f in md_files if not f.stem.endswith(tuple(f".v{i}" for i in range(100)))]
-
     if scope == "last-run":
         # Take the most recently modified files (up to 20)
-        md_files = sorted(md_files, key=lambda f: f.stat().st_mtime, reverse=True)[:20]
+        md_files = list_recent_analysis_files(analysis_dir, 20)
+    else:
+        md_files = list_analysis_files(analysis_dir)
 
     if not md_files:
         return "(No paper analyses available)"
@@ -64,11 +69,11 @@ def _gather_analyses(scope: str, data_dir: Path) -> str:
     summaries = []
     for md in md_files[:50]:  # Cap at 50 to avoid token overflow
         try:
-            content = md.read_text(encoding="utf-8")
-            # Take first 500 chars as summary
-            summary = content[:500]
-            if len(content) > 500:
-                summary += "..."
+            # Take first 500 chars as summary; read one extra to know whether it was cut
+            with md.open("r", encoding="utf-8") as f:
+                summary = f.read(501)
+            if len(summary) > 500:
+                summary = summary[:500] + "..."
             summaries.append(f"### {md.stem}\n{summary}")
         except Exception as e:
             logger.warning("Failed to read %s: %s", md, e)
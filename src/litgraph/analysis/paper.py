@@ -6,13 +6,17 @@ import logging
 import os
 import re
 import shutil
-import tempfile
-import urllib.request
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+import httpx
+import orjson
 import yaml
 
+from litgraph.fileio import atomic_write_bytes, atomic_write_text
+from litgraph.llm.cache import ResponseCache
 from litgraph.llm.client import complete
 from litgraph.llm.prompts import (
     format_questions_block,
@@ -22,23 +26,60 @@ from litgraph.llm.prompts import (
 )
 from litgraph.retry import with_retry
 from litgraph.settings import get_settings
+from litgraph.yamlio import YamlDumper
 
 logger = logging.getLogger(__name__)
 
+# Downloaded PDFs above this size are skipped rather than held in memory
+_MAX_PDF_BYTES = 50 * 1024 * 1024
 
-def analyze_paper(paper: dict, data_dir: Path) -> Path | None:
+# Shared HTTP client for PDF downloads: keeps connections to arxiv & co. alive across papers
+_http_client: httpx.Client | None = None
+_http_client_lock = threading.Lock()
+
+# Sidecar in the analysis dir mapping safe_id → [questions_version, st_mtime_ns,
+# st_size] of the current analysis, so the skip check need not open and parse each
+# existing Markdown file. Loaded once per directory; entries that are missing or
+# whose stamp no longer matches the file fall back to the front matter.
+_VERSION_INDEX_NAME = "_versions.json"
+_version_indexes: dict[Path, dict[str, list[int]]] = {}
+_version_index_lock = threading.Lock()
+
+# cleanup_pdf_text patterns, compiled once at import
+_HYPHEN_BREAK_RE = re.compile(r"(\w)-\n(\w)")
+_PAGE_NUMBER_RE = re.compile(r"^\s*\d+\s*$", re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# paper_id → analysis file stem ("arxiv:2401.12345" → "arxiv_2401.12345")
+_SAFE_ID_TABLE = str.maketrans({":": "_", "/": "_"})
+
+# Backups renamed aside on a questions_version change: <safe_id>.v<N>.md
+_VERSIONED_BACKUP_RE = re.compile(r"\.v\d+\.md$")
+
+# The one front-matter field the skip check needs; matched per line instead of
+# running a YAML parse over the whole block
+_QUESTIONS_VERSION_RE = re.compile(r"questions_version:\s*(\d+)\s*$")
+
+
+def analyze_paper(paper: dict, data_dir: Path, pdf_executor: Executor | None = None) -> Path | None:
     """Full analysis flow for a single paper.
 
     1. Check existing analysis → skip if questions_version matches.
-    2. Download PDF to tempfile → extract text → delete PDF.
-    3. Render prompt → LLM → write Markdown with YAML front matter.
+    2. Download PDF into memory → extract text.
+    3. Render prompt → LLM (via the response cache) → write Markdown with YAML front matter.
+
+    Args:
+        paper: Paper record from index.json.
+        data_dir: DATA directory path.
+        pdf_executor: Optional process pool to run PDF text extraction on. Used by
+            analyze_batch so extraction of concurrent papers spreads across cores.
 
     Returns:
         Path to the analysis Markdown file, or None on failure.
     """
     settings = get_settings()
     paper_id = paper.get("paper_id") or paper.get("dedup_key", "unknown")
-    safe_id = paper_id.replace(":", "_").replace("/", "_")
+    safe_id = safe_paper_id(paper_id)
 
     analysis_dir = data_dir / "analysis"
     analysis_dir.mkdir(parents=True, exist_ok=True)
@@ -57,7 +98,11 @@ def analyze_paper(paper: dict, data_dir: Path) -> Path | None:
     # Check existing analysis
     current_version = get_questions_version()
     if md_path.exists():
-        existing_version = _extract_questions_version(md_path)
+        existing_version = _indexed_version(analysis_dir, safe_id, md_path)
+        if existing_version is None:
+            existing_version = _extract_questions_version(md_path)
+            if existing_version is not None:
+                _record_version(analysis_dir, safe_id, existing_version, md_path)
         if existing_version == current_version:
             logger.info("Skipping %s — already analyzed with questions v%d", paper_id, current_version)
             return md_path
@@ -73,7 +118,7 @@ def analyze_paper(paper: dict, data_dir: Path) -> Path | None:
     source_type = "abstract_only"
     pdf_url = paper.get("pdf_url")
     if pdf_url:
-        full_text = _download_and_extract_pdf(pdf_url)
+        full_text = _download_and_extract_pdf(pdf_url, pdf_executor)
         if full_text:
             source_type = "full_text"
 
@@ -92,12 +137,22 @@ def analyze_paper(paper: dict, data_dir: Path) -> Path | None:
         questions_block=questions_block,
     )
 
-    # Call LLM
-    try:
-        response = complete(user_prompt, system_prompt=system_prompt, model="best")
-    except Exception as e:
-        logger.error("LLM analysis failed for %s: %s", paper_id, e)
-        return None
+    # Call LLM, reusing a cached response for an identical request. questions_version
+    # is part of the key so bumping it always forces a fresh analysis.
+    cache = ResponseCache(data_dir / "llm_cache")
+    cache_key = cache.key(
+        settings.llm.best_model, system_prompt, user_prompt, questions_version=current_version,
+    )
+    response = cache.get(cache_key)
+    if response is None:
+        try:
+            response = complete(user_prompt, system_prompt=system_prompt, model="best")
+        except Exception as e:
+            logger.error("LLM analysis failed for %s: %s", paper_id, e)
+            return None
+        cache.set(cache_key, response)
+    else:
+        logger.info("Using cached LLM response for %s", paper_id)
 
     # Write Markdown with YAML front matter
     front_matter = {
@@ -115,27 +170,91 @@ def analyze_paper(paper: dict, data_dir: Path) -> Path | None:
     }
 
     content = "---\n"
-    content += yaml.dump(front_matter, default_flow_style=False, allow_unicode=True)
+    content += yaml.dump(front_matter, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True)
     content += "---\n\n"
     content += f"# {paper.get('title', 'Unknown')}\n\n"
     content += response
 
-    md_path.write_text(content, encoding="utf-8")
+    # Atomic so an interrupted run never leaves a truncated analysis that would be skipped
+    atomic_write_text(md_path, content)
+    _record_version(analysis_dir, safe_id, current_version, md_path)
     logger.info("Wrote analysis: %s (%s)", md_path.name, source_type)
     return md_path
 
 
-def extract_pdf_text(pdf_path: str | Path, max_pages: int = 50) -> str:
-    """Extract text from a PDF using pymupdf."""
+def _get_http_client() -> httpx.Client:
+    """Lazy-initialize the pooled httpx client used for PDF downloads."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                timeout=30.0,
+                follow_redirects=True,
+                headers={"User-Agent": "litgraph/0.1 (+https://github.com/RunningStone/LitGraph)"},
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+    return _http_client
+
+
+def reset_http_client() -> None:
+    """Close and drop the PDF download client (for tests)."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+
+
+def list_analysis_files(analysis_dir: Path) -> list[Path]:
+    """Return current analysis Markdown files sorted by name, excluding versioned backups."""
+    return sorted(f for f in analysis_dir.glob("*.md") if not _VERSIONED_BACKUP_RE.search(f.name))
+
+
+def read_analysis_texts(md_files: list[Path], max_workers: int = 16) -> list[str]:
+    """Read analysis files on a small thread pool, preserving order.
+
+    Each read is latency-bound on network filesystems, so overlapping them pays
+    off for KG inserts of many files.
+    """
+    if len(md_files) < 2:
+        return [f.read_text(encoding="utf-8") for f in md_files]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(md_files))) as executor:
+        return list(executor.map(lambda f: f.read_text(encoding="utf-8"), md_files))
+
+
+def list_recent_analysis_files(analysis_dir: Path, limit: int) -> list[Path]:
+    """Return up to ``limit`` current analysis files, most recently modified first.
+
+    Uses a single os.scandir pass; ties on mtime keep name order.
+    """
+    with os.scandir(analysis_dir) as it:
+        entries = [
+            e for e in it
+            if e.name.endswith(".md") and not _VERSIONED_BACKUP_RE.search(e.name) and e.is_file()
+        ]
+    entries.sort(key=lambda e: e.name)
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    return [Path(e.path) for e in entries[:limit]]
+
+
+def extract_pdf_text(pdf: str | Path | bytes, max_pages: int = 50) -> str:
+    """Extract text from a PDF using pymupdf (first ``max_pages`` pages only).
+
+    Args:
+        pdf: Path to a PDF file, or the raw PDF bytes.
+        max_pages: Maximum number of pages to read.
+    """
     import pymupdf
 
-    doc = pymupdf.open(str(pdf_path))
-    pages = []
-    for i, page in enumerate(doc):
-        if i >= max_pages:
-            break
-        pages.append(page.get_text())
-    doc.close()
+    if isinstance(pdf, bytes):
+        doc = pymupdf.open(stream=pdf, filetype="pdf")
+    else:
+        doc = pymupdf.open(str(pdf))
+    with doc:
+        pages = [
+            page.get_text("text", flags=pymupdf.TEXTFLAGS_TEXT)
+            for page in doc.pages(0, min(max_pages, doc.page_count))
+        ]
     return "\n".join(pages)
 
 
@@ -146,29 +265,40 @@ def cleanup_pdf_text(text: str) -> str:
     - Merge hyphenated line breaks (e.g. 'founda-\\ntion' → 'foundation').
     """
     # Merge hyphenated breaks
-    text = re.sub(r"(\w)-\n(\w)", r"\1\2", text)
+    text = _HYPHEN_BREAK_RE.sub(r"\1\2", text)
     # Remove standalone page numbers
-    text = re.sub(r"^\s*\d+\s*$", "", text, flags=re.MULTILINE)
+    text = _PAGE_NUMBER_RE.sub("", text)
     # Collapse excessive blank lines
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
     return text.strip()
 
 
 @with_retry
-def _download_and_extract_pdf(pdf_url: str) -> str | None:
-    """Download PDF to temp file, extract text, delete PDF. 30s timeout."""
-    try:
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            tmp_path = tmp.name
-            with urllib.request.urlopen(pdf_url, timeout=30) as resp:
-                tmp.write(resp.read())
+def _download_and_extract_pdf(pdf_url: str, pdf_executor: Executor | None = None) -> str | None:
+    """Download PDF into memory and extract its text. 30s timeout.
 
-        text = extract_pdf_text(tmp_path)
+    Uses the shared keep-alive client. PDFs larger than ``_MAX_PDF_BYTES`` are
+    skipped. Extraction runs on ``pdf_executor`` when given, otherwise in-process.
+    """
+    try:
+        chunks = []
+        size = 0
+        with _get_http_client().stream("GET", pdf_url) as resp:
+            resp.raise_for_status()
+            for chunk in resp.iter_bytes():
+                size += len(chunk)
+                if size > _MAX_PDF_BYTES:
+                    logger.warning("PDF exceeds %d MB, skipping: %s", _MAX_PDF_BYTES // (1024 * 1024), pdf_url)
+                    return None
+                chunks.append(chunk)
+        data = b"".join(chunks)
+
+        if pdf_executor is not None:
+            text = pdf_executor.submit(extract_pdf_text, data).result()
+        else:
+            text = extract_pdf_text(data)
         text = cleanup_pdf_text(text)
 
-        # Delete temp PDF
-        Path(tmp_path).unlink(missing_ok=True)
-
         if len(text.strip()) < 100:
             logger.warning("PDF text too short (%d chars), likely extraction failure", len(text))
             return None
@@ -176,22 +306,82 @@ def _download_and_extract_pdf(pdf_url: str) -> str | None:
         return text
     except Exception as e:
         logger.warning("PDF download/extraction failed for %s: %s", pdf_url, e)
-        # Clean up temp file if it exists
+        return None
+
+
+def _version_index(analysis_dir: Path) -> dict[str, list[int]]:
+    """Return the cached version sidecar for ``analysis_dir``. Caller holds the lock."""
+    index = _version_indexes.get(analysis_dir)
+    if index is None:
         try:
-            Path(tmp_path).unlink(missing_ok=True)
-        except (NameError, OSError):
-            pass
+            index = orjson.loads((analysis_dir / _VERSION_INDEX_NAME).read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            index = {}
+        _version_indexes[analysis_dir] = index
+    return index
+
+
+def _file_stamp(path: Path) -> list[int] | None:
+    """(st_mtime_ns, st_size) of a file, or None if it cannot be stat'ed."""
+    try:
+        st = path.stat()
+    except OSError:
         return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _indexed_version(analysis_dir: Path, safe_id: str, md_path: Path) -> int | None:
+    """Look up the recorded questions_version of an existing analysis.
+
+    Returns None unless the entry's stamp matches ``md_path`` as it is now, so a
+    replaced or restored file (or one written just before a crash that kept the
+    sidecar from being updated) is re-read from its front matter.
+    """
+    stamp = _file_stamp(md_path)
+    with _version_index_lock:
+        entry = _version_index(analysis_dir).get(safe_id)
+    if stamp is None or not isinstance(entry, list) or entry[1:] != stamp:
+        return None
+    return entry[0]
+
+
+def _record_version(analysis_dir: Path, safe_id: str, version: int, md_path: Path) -> None:
+    """Record an analysis' questions_version and file stamp in the sidecar (memory + disk)."""
+    stamp = _file_stamp(md_path)
+    if stamp is None:
+        return
+    entry = [version, *stamp]
+    with _version_index_lock:
+        index = _version_index(analysis_dir)
+        if index.get(safe_id) == entry:
+            return
+        index[safe_id] = entry
+        try:
+            atomic_write_bytes(analysis_dir / _VERSION_INDEX_NAME, orjson.dumps(index))
+        except OSError as e:
+            logger.warning("Failed to update %s: %s", _VERSION_INDEX_NAME, e)
+
+
+def safe_paper_id(paper_id: str) -> str:
+    """File-name-safe form of a paper id, used as the analysis Markdown stem."""
+    return paper_id.translate(_SAFE_ID_TABLE)
 
 
 def _extract_questions_version(md_path: Path) -> int | None:
     """Extract questions_version from YAML front matter of an analysis Markdown."""
     try:
-        content = md_path.read_text(encoding="utf-8")
-        if not content.startswith("---"):
+        # Read only the front matter block, not the (possibly large) analysis body
+        with md_path.open("r", encoding="utf-8") as f:
+            if f.readline().rstrip() != "---":
+                return None
+            version = None
+            for line in f:
+                if line.rstrip() == "---":
+                    return version
+                if version is None:
+                    m = _QUESTIONS_VERSION_RE.match(line)
+                    if m:
+                        version = int(m.group(1))
             return None
-        end = content.index("---", 3)
-        front_matter = yaml.safe_load(content[3:end])
-        return front_matter.get("questions_version")
-    except Exception:
+    except (OSError, UnicodeDecodeError):
         return None
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import json
 import logging
-import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -23,10 +22,8 @@ def _setup_logging(verbose: bool = False) -> None:
     )
 
 
-def _warn_lite_mode() -> None:
+def _warn_lite_mode(settings) -> None:
     """Print Lite mode warning."""
-    from litgraph.settings import get_settings
-    settings = get_settings()
     if settings.mode == "lite":
         click.secho(
             f"WARNING: Running in Lite mode ({settings.llm.best_model})\n"
@@ -39,6 +36,11 @@ def _warn_lite_mode() -> None:
         )
 
 
+def _count_relevant(papers: list[dict]) -> int:
+    """Number of papers carrying the relevance marker set by filter_papers."""
+    return sum(1 for p in papers if p.get("relevant"))
+
+
 @click.group()
 @click.option("--mode", type=click.Choice(["pro", "lite"]), default=None,
               help="Override LLM mode (pro or lite).")
@@ -48,16 +50,14 @@ def main(ctx, mode, verbose):
     """LitGraph: Literature analysis knowledge graph service."""
     _setup_logging(verbose)
 
-    if mode:
-        os.environ["LITGRAPH_MODE"] = mode
-
-    from litgraph.settings import get_settings, reset_settings
-    reset_settings()
-    get_settings()
+    # Load settings once per invocation; --mode overrides LITGRAPH_MODE without touching os.environ
+    from litgraph.settings import get_settings
+    settings = get_settings(force_reload=True, mode=mode)
 
-    _warn_lite_mode()
+    _warn_lite_mode(settings)
 
     ctx.ensure_object(dict)
+    ctx.obj["settings"] = settings
 
 
 @main.command()
@@ -65,12 +65,12 @@ def main(ctx, mode, verbose):
 @click.option("--sources", default="arxiv,semantic", help="Comma-separated sources.")
 @click.option("--max-results", default=50, type=int, help="Max results per source.")
 @click.option("--year-from", default=None, type=int, help="Minimum publication year.")
-def search(keywords, sources, max_results, year_from):
+@click.pass_obj
+def search(obj, keywords, sources, max_results, year_from):
     """Search for papers across academic databases."""
     from litgraph.search.dedup import dedup_paper_list, merge_into_index
-    from litgraph.settings import get_settings
 
-    settings = get_settings()
+    settings = obj["settings"]
     source_list = [s.strip() for s in sources.split(",")]
     all_papers = []
 
@@ -102,26 +102,26 @@ def search(keywords, sources, max_results, year_from):
 @main.command("filter")
 @click.option("--min-citations", default=5, type=int, help="Minimum citation count.")
 @click.option("--relevance-check", is_flag=True, help="Use LLM for relevance scoring.")
-def filter_cmd(min_citations, relevance_check):
+@click.pass_obj
+def filter_cmd(obj, min_citations, relevance_check):
     """Filter papers by citation count and optional LLM relevance."""
+    from litgraph.search.dedup import load_index, save_index
     from litgraph.search.filters import filter_papers
-    from litgraph.settings import get_settings
 
-    settings = get_settings()
+    settings = obj["settings"]
     index_path = settings.data_dir / "papers" / "index.json"
 
     if not index_path.exists():
         click.secho("No index.json found. Run 'search' first.", fg="red", err=True)
         sys.exit(2)
 
-    with open(index_path) as f:
-        papers = json.load(f)
-
+    papers = load_index(index_path)
+    marked = _count_relevant(papers)
     filtered = filter_papers(papers, min_citations=min_citations, use_llm_filter=relevance_check)
 
-    # Update index with relevance markers
-    with open(index_path, "w") as f:
-        json.dump(papers, f, indent=2, ensure_ascii=False)
+    # Update index with relevance markers (skipped when no new paper was marked)
+    if _count_relevant(papers) != marked:
+        save_index(papers, index_path)
 
     click.echo(f"Filtered: {len(filtered)}/{len(papers)} papers passed")
 
@@ -129,12 +129,12 @@ def filter_cmd(min_citations, relevance_check):
 @main.command()
 @click.option("--paper-ids", "-p", multiple=True, help="Specific paper IDs to analyze.")
 @click.option("--all-pending", is_flag=True, help="Analyze all papers without analysis.")
-def analyze(paper_ids, all_pending):
+@click.pass_obj
+def analyze(obj, paper_ids, all_pending):
     """Analyze papers using LLM."""
     from litgraph.analysis.batch import analyze_batch
-    from litgraph.settings import get_settings
 
-    settings = get_settings()
+    settings = obj["settings"]
     stats = analyze_batch(
         paper_ids=list(paper_ids) if paper_ids else None,
         all_pending=all_pending,
@@ -157,37 +157,30 @@ def kg():
 @kg.command()
 @click.option("--paper-ids", "-p", multiple=True, help="Specific paper IDs.")
 @click.option("--all-pending", is_flag=True, help="Insert all unprocessed papers.")
-def update(paper_ids, all_pending):
+@click.pass_obj
+def update(obj, paper_ids, all_pending):
     """Update the knowledge graph with paper analyses."""
+    from litgraph.analysis.paper import list_analysis_files, read_analysis_texts, safe_paper_id
     from litgraph.kg.graph import insert_texts
-    from litgraph.settings import get_settings
 
-    settings = get_settings()
+    settings = obj["settings"]
     analysis_dir = settings.data_dir / "analysis"
 
     if not analysis_dir.exists():
         click.secho("No analysis directory. Run 'analyze' first.", fg="red", err=True)
         sys.exit(2)
 
-    md_files = sorted(analysis_dir.glob("*.md"))
-    md_files = [f for f in md_files if not any(f.stem.endswith(f".v{i}") for i in range(100))]
+    md_files = list_analysis_files(analysis_dir)
 
     if paper_ids:
-        selected = []
-        for f in md_files:
-            for pid in paper_ids:
-                safe_pid = pid.replace(":", "_").replace("/", "_")
-                if f.stem == safe_pid:
-                    selected.append(f)
-        md_files = selected
+        wanted = {safe_paper_id(pid) for pid in paper_ids}
+        md_files = [f for f in md_files if f.stem in wanted]
 
     if not md_files:
         click.echo("No papers to insert into KG.")
         return
 
-    texts = []
-    for f in md_files:
-        texts.append(f.read_text(encoding="utf-8"))
+    texts = read_analysis_texts(md_files)
 
     click.echo(f"Inserting {len(texts)} papers into KG...")
     insert_texts(texts)
@@ -209,12 +202,12 @@ def query(question, query_mode):
 @click.option("--keywords", "-k", multiple=True, required=True, help="Seed keywords.")
 @click.option("--max-hops", default=2, type=int)
 @click.option("--max-results", default=20, type=int)
-def expand(keywords, max_hops, max_results):
+@click.pass_obj
+def expand(obj, keywords, max_hops, max_results):
     """Expand keywords using the knowledge graph."""
     from litgraph.kg.direct import expand_keywords, load_graph
-    from litgraph.settings import get_settings
 
-    settings = get_settings()
+    settings = obj["settings"]
     kg_dir = settings.data_dir / "kg_store"
     graphml_files = list(kg_dir.glob("*.graphml")) if kg_dir.exists() else []
 
@@ -230,12 +223,12 @@ def expand(keywords, max_hops, max_results):
 
 
 @kg.command()
-def stats():
+@click.pass_obj
+def stats(obj):
     """Show knowledge graph statistics."""
     from litgraph.kg.direct import get_stats, load_graph
-    from litgraph.settings import get_settings
 
-    settings = get_settings()
+    settings = obj["settings"]
     kg_dir = settings.data_dir / "kg_store"
     graphml_files = list(kg_dir.glob("*.graphml")) if kg_dir.exists() else []
 
@@ -257,13 +250,13 @@ def stats():
 
 @main.command()
 @click.option("--scope", default="all", type=click.Choice(["all", "last-run"]))
-def innovate(scope):
+@click.pass_obj
+def innovate(obj, scope):
     """Identify innovation opportunities."""
     from litgraph.analysis.innovation import identify_innovations
     from litgraph.output.report import save_report
-    from litgraph.settings import get_settings
 
-    settings = get_settings()
+    settings = obj["settings"]
     click.echo(f"Running innovation analysis (scope: {scope})...")
     report = identify_innovations(scope=scope, data_dir=settings.data_dir)
     path = save_report(report, "innovation", settings.data_dir)
@@ -277,17 +270,19 @@ def innovate(scope):
 @click.option("--year-from", default=None, type=int)
 @click.option("--min-citations", default=5, type=int)
 @click.option("--resume", is_flag=True, help="Skip completed steps.")
-def run(keywords, sources, max_results, year_from, min_citations, resume):
+@click.pass_obj
+def run(obj, keywords, sources, max_results, year_from, min_citations, resume):
     """Run the full pipeline: search → filter → analyze → KG → innovate."""
     from litgraph.analysis.batch import analyze_batch
     from litgraph.analysis.innovation import identify_innovations
+    from litgraph.analysis.paper import list_analysis_files, read_analysis_texts
+    from litgraph.fileio import atomic_write_text
     from litgraph.kg.graph import insert_texts
     from litgraph.output.report import save_report
-    from litgraph.search.dedup import dedup_paper_list, merge_into_index
+    from litgraph.search.dedup import dedup_paper_list, load_index, merge_into_index, save_index
     from litgraph.search.filters import filter_papers
-    from litgraph.settings import get_settings
 
-    settings = get_settings()
+    settings = obj["settings"]
     data_dir = settings.data_dir
     data_dir.mkdir(parents=True, exist_ok=True)
 
@@ -342,12 +337,12 @@ def run(keywords, sources, max_results, year_from, min_citations, resume):
 
     # Step 2: Filter
     click.echo("Step 2: Filtering papers...")
-    with open(index_path) as f:
-        papers = json.load(f)
+    papers = load_index(index_path)
+    marked = _count_relevant(papers)
     filtered = filter_papers(papers, list(keywords), min_citations=min_citations)
-    # Write back index with relevance markers
-    with open(index_path, "w") as f:
-        json.dump(papers, f, indent=2, ensure_ascii=False)
+    # Write back index with relevance markers (skipped when no new paper was marked)
+    if _count_relevant(papers) != marked:
+        save_index(papers, index_path)
     click.echo(f"  {len(filtered)} papers passed filter")
     run_record["steps"]["filter"] = {"passed": len(filtered)}
 
@@ -362,10 +357,9 @@ def run(keywords, sources, max_results, year_from, min_citations, resume):
     click.echo("Step 4: Updating knowledge graph...")
     analysis_dir = data_dir / "analysis"
     if analysis_dir.exists():
-        md_files = sorted(analysis_dir.glob("*.md"))
-        md_files = [f for f in md_files if not any(f.stem.endswith(f".v{i}") for i in range(100))]
+        md_files = list_analysis_files(analysis_dir)
         if md_files:
-            texts = [f.read_text(encoding="utf-8") for f in md_files]
+            texts = read_analysis_texts(md_files)
             insert_texts(texts)
             click.echo(f"  Inserted {len(texts)} texts into KG")
             run_record["steps"]["kg_update"] = {"inserted": len(texts)}
@@ -392,8 +386,7 @@ def run(keywords, sources, max_results, year_from, min_citations, resume):
     runs_dir = data_dir / "runs"
     runs_dir.mkdir(parents=True, exist_ok=True)
     run_path = runs_dir / f"{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.json"
-    with open(run_path, "w") as f:
-        json.dump(run_record, f, indent=2, ensure_ascii=False)
+    atomic_write_text(run_path, json.dumps(run_record, indent=2, ensure_ascii=False))
     click.echo(f"Run record: {run_path}")
 
 
@@ -404,11 +397,10 @@ def config():
 
 
 @config.command("show")
-def config_show():
+@click.pass_obj
+def config_show(obj):
     """Show current configuration."""
-    from litgraph.settings import get_settings
-
-    settings = get_settings()
+    settings = obj["settings"]
     click.echo(f"Mode: {settings.mode}")
     click.echo(f"Data dir: {settings.data_dir}")
 
@@ -428,11 +420,10 @@ def config_show():
 
 
 @config.command("validate")
-def config_validate():
+@click.pass_obj
+def config_validate(obj):
     """Validate configuration (ping LLM, check embedding model)."""
-    from litgraph.settings import get_settings
-
-    settings = get_settings()
+    settings = obj["settings"]
     errors = []
 
     # Test LLM
@@ -458,9 +449,8 @@ def config_validate():
     # Test embedding model
     click.echo(f"Testing embedding model ({settings.embedding_model})...")
     try:
-        from sentence_transformers import SentenceTransformer
-        model = SentenceTransformer(settings.embedding_model)
-        emb = model.encode(["test"])
+        from litgraph.llm.embedding import embed_texts
+        emb = embed_texts(["test"], settings.embedding_model)
         if emb is not None and len(emb) > 0:
             click.secho(f"  Embedding: OK (dim={emb.shape[1]})", fg="green")
         else:
@@ -0,0 +1,32 @@
+"""Crash-safe file writes: write a sibling temp file, then atomically replace the target."""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to path so readers never observe a partially written file.
+
+    The data goes to a temp file in the same directory, is fsynced, and is then
+    moved over the target with os.replace (atomic on POSIX and Windows), so a
+    crash or power loss leaves either the old or the new content.
+    """
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_text(path: Path, text: str, encoding: str = "utf-8") -> None:
+    """Text variant of atomic_write_bytes."""
+    atomic_write_bytes(path, text.encode(encoding))
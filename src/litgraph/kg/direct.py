@@ -3,13 +3,42 @@
 from __future__ import annotations
 
 import logging
-from collections import deque
+import weakref
+from collections import Counter, deque
+from itertools import chain
 from pathlib import Path
 
 import networkx as nx
 
 logger = logging.getLogger(__name__)
 
+# Derived lookup structures per graph object. Held weakly so graphs are not kept
+# alive, and outside graph.graph so they never end up in written GraphML.
+_graph_caches: weakref.WeakKeyDictionary[nx.Graph, dict] = weakref.WeakKeyDictionary()
+
+
+def invalidate_graph_cache(graph: nx.Graph) -> None:
+    """Drop cached lookups for a graph after it was modified in place."""
+    _graph_caches.pop(graph, None)
+
+
+def _node_name_index(graph: nx.Graph, rebuild: bool = False) -> dict[str, str]:
+    """Map lowercased node name → node, for case-insensitive seed lookup.
+
+    The first node (in graph order) wins when several names collide after
+    lowercasing. Rebuilt whenever the node count changes or ``rebuild`` is set;
+    a remove+add that keeps the count is only caught by the caller's miss check.
+    """
+    cache = _graph_caches.setdefault(graph, {})
+    cached = cache.get("name_index")
+    if not rebuild and cached is not None and cached[0] == graph.number_of_nodes():
+        return cached[1]
+    index: dict[str, str] = {}
+    for node in graph.nodes:
+        index.setdefault(str(node).lower(), node)
+    cache["name_index"] = (graph.number_of_nodes(), index)
+    return index
+
 
 def load_graph(graphml_path: Path | str) -> nx.Graph:
     """Load a NetworkX graph from a GraphML file.
@@ -31,7 +60,9 @@ def expand_keywords(
 ) -> list[str]:
     """BFS expand from seed nodes to find related keywords.
 
-    Only considers Concept, Method, and Task nodes.
+    Only considers Concept, Method, and Task nodes. Each node's neighbours
+    are visited highest-degree first, so when max_results cuts the search
+    short the hub concepts are kept.
 
     Args:
         graph: NetworkX graph.
@@ -40,40 +71,57 @@ def expand_keywords(
         max_results: Maximum number of results.
 
     Returns:
-        List of expanded keyword strings.
+        List of expanded keyword strings, nearest first.
     """
     expandable_types = {"Concept", "Method", "Task"}
-    results = set()
+    # Insertion-ordered, so results come back in BFS order
+    results: dict[str, None] = {}
     visited = set()
 
     queue: deque[tuple[str, int]] = deque()
 
+    adj = graph.adj
+    nodes = graph.nodes
+    degree = graph.degree
+
+    def discover(node) -> None:
+        # Nodes are collected when first reached; BFS pops them in this same order
+        node_data = nodes[node]
+        if node_data.get("entity_type", "") in expandable_types and len(results) < max_results:
+            results[node_data.get("name", str(node))] = None
+
+    name_index = _node_name_index(graph)
+    rebuilt = False
     for seed in seeds:
-        # Find matching nodes (case-insensitive)
-        seed_lower = seed.lower()
-        for node in graph.nodes:
-            if str(node).lower() == seed_lower:
+        # Find matching node (case-insensitive)
+        node = name_index.get(seed.lower())
+        if (node is None or node not in graph) and not rebuilt:
+            # The index may be stale after in-place edits that kept the node
+            # count; rescan the graph once before treating the seed as unknown
+            name_index = _node_name_index(graph, rebuild=True)
+            rebuilt = True
+            node = name_index.get(seed.lower())
+        if node is not None and node in graph and node not in visited:
+            visited.add(node)
+            discover(node)
+            if max_hops > 0:
                 queue.append((node, 0))
-                visited.add(node)
-                break
 
     while queue and len(results) < max_results:
         node, depth = queue.popleft()
+        for neighbor in sorted(adj[node], key=degree.__getitem__, reverse=True):
+            if neighbor in visited:
+                continue
+            visited.add(neighbor)
+            discover(neighbor)
+            if len(results) >= max_results:
+                break
+            # Nodes on the last hop are never expanded, so they are not queued.
+            # Other types are still queued: papers connect the concepts.
+            if depth + 1 < max_hops:
+                queue.append((neighbor, depth + 1))
 
-        # Add to results if it's an expandable type
-        node_data = graph.nodes.get(node, {})
-        node_type = node_data.get("entity_type", "")
-        if node_type in expandable_types:
-            node_name = node_data.get("name", str(node))
-            results.add(node_name)
-
-        if depth < max_hops:
-            for neighbor in graph.neighbors(node):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, depth + 1))
-
-    return list(results)[:max_results]
+    return list(results)
 
 
 def get_subgraph(
@@ -94,26 +142,20 @@ def get_subgraph(
     if center_node not in graph:
         return nx.Graph()
 
-    nodes = set()
-    visited = set()
-    queue: deque[tuple[str, int]] = deque([(center_node, 0)])
-    visited.add(center_node)
-
-    while queue:
-        node, depth = queue.popleft()
-        nodes.add(node)
-
-        if depth < max_hops:
-            for neighbor in graph.neighbors(node):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, depth + 1))
-
+    # The common 1- and 2-hop shapes are plain neighbourhood unions
+    adj = graph.adj
+    if max_hops == 1:
+        nodes = {center_node, *adj[center_node]}
+    elif max_hops == 2:
+        hop1 = set(adj[center_node])
+        nodes = {center_node} | hop1 | set(chain.from_iterable(adj[n] for n in hop1))
+    else:
+        nodes = nx.single_source_shortest_path_length(graph, center_node, cutoff=max_hops)
     return graph.subgraph(nodes).copy()
 
 
 def get_stats(graph: nx.Graph) -> dict:
-    """Get basic statistics about the graph.
+    """Get basic statistics about the graph (one O(V+E) pass).
 
     Returns:
         Dict with node_count, edge_count, node_types, relation_types.
@@ -126,15 +168,8 @@ def get_stats(graph: nx.Graph) -> dict:
             "relation_types": {},
         }
 
-    node_types: dict[str, int] = {}
-    for _, data in graph.nodes(data=True):
-        nt = data.get("entity_type", "unknown")
-        node_types[nt] = node_types.get(nt, 0) + 1
-
-    relation_types: dict[str, int] = {}
-    for _, _, data in graph.edges(data=True):
-        rt = data.get("relation_type", "unknown")
-        relation_types[rt] = relation_types.get(rt, 0) + 1
+    node_types = dict(Counter(data.get("entity_type", "unknown") for _, data in graph.nodes(data=True)))
+    relation_types = dict(Counter(data.get("relation_type", "unknown") for _, _, data in graph.edges(data=True)))
 
     return {
         "node_count": graph.number_of_nodes(),
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 
 import numpy as np
 
+from litgraph.kg.direct import invalidate_graph_cache
 from litgraph.kg.schema import normalize_entity
 from litgraph.settings import get_settings
 
@@ -22,20 +24,33 @@ class SchemaAwareStorage:
 
     @staticmethod
     def patch_storage(storage):
-        """Patch a NetworkXStorage instance to normalize entities on upsert."""
+        """Patch a NetworkXStorage instance to normalize entities on upsert.
+
+        Upserts also drop the kg.direct caches (seed name index) of the
+        storage's in-memory graph.
+        """
         original_upsert_node = storage.upsert_node
         original_upsert_edge = storage.upsert_edge
 
+        def _invalidate():
+            graph = getattr(storage, "_graph", None)
+            if graph is not None:
+                invalidate_graph_cache(graph)
+
         async def patched_upsert_node(node_id, node_data=None):
             node_id = normalize_entity(str(node_id))
             if node_data and "name" in node_data:
                 node_data["name"] = normalize_entity(str(node_data["name"]))
-            return await original_upsert_node(node_id, node_data)
+            result = await original_upsert_node(node_id, node_data)
+            _invalidate()
+            return result
 
         async def patched_upsert_edge(src_id, tgt_id, edge_data=None):
             src_id = normalize_entity(str(src_id))
             tgt_id = normalize_entity(str(tgt_id))
-            return await original_upsert_edge(src_id, tgt_id, edge_data)
+            result = await original_upsert_edge(src_id, tgt_id, edge_data)
+            _invalidate()
+            return result
 
         storage.upsert_node = patched_upsert_node
         storage.upsert_edge = patched_upsert_edge
@@ -44,25 +59,22 @@ class SchemaAwareStorage:
 
 
 def _make_embedding_func():
-    """Create a local SentenceTransformer embedding function for nano-graphrag."""
+    """Create a local SentenceTransformer embedding function for nano-graphrag.
+
+    The model is loaded here rather than on the first insert, and encoding
+    runs in a worker thread so it does not block nano-graphrag's event loop.
+    """
     from nano_graphrag._utils import wrap_embedding_func_with_attrs
-    settings = get_settings()
-    model_name = settings.embedding_model
 
-    _model = None
+    from litgraph.llm.embedding import embed_texts, get_embedding_model
 
-    def _get_model():
-        nonlocal _model
-        if _model is None:
-            from sentence_transformers import SentenceTransformer
-            _model = SentenceTransformer(model_name)
-        return _model
+    settings = get_settings()
+    model_name = settings.embedding_model
+    get_embedding_model(model_name)
 
     @wrap_embedding_func_with_attrs(embedding_dim=384, max_token_size=512)
     async def local_embedding(texts: list[str]) -> np.ndarray:
-        model = _get_model()
-        embeddings = model.encode(texts, normalize_embeddings=True)
-        return np.array(embeddings)
+        return await asyncio.to_thread(embed_texts, texts, model_name)
 
     return local_embedding
 
@@ -91,9 +103,9 @@ def get_rag(working_dir: str | Path | None = None):
     try:
         entity_prompt_path = settings.prompts_dir / "entity_extraction.yaml"
         if entity_prompt_path.exists():
-            import yaml
-            with open(entity_prompt_path) as f:
-                entity_data = yaml.safe_load(f)
+            from litgraph.llm.prompts import load_prompt_yaml
+
+            entity_data = load_prompt_yaml(entity_prompt_path)
             # Prepend domain-specific guidance to nano-graphrag's prompt
             domain_guidance = entity_data.get("system", "").strip()
             if domain_guidance:
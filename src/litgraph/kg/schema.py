@@ -8,10 +8,13 @@ from pathlib import Path
 import yaml
 
 from litgraph.settings import get_settings
+from litgraph.yamlio import YamlLoader
 
 logger = logging.getLogger(__name__)
 
 _schema_cache: dict | None = None
+# Lowercased alias → canonical name for the cached (default) schema
+_alias_index_cache: dict[str, str] | None = None
 
 
 def _load_schema(schema_dict: dict | None = None) -> dict:
@@ -26,7 +29,7 @@ def _load_schema(schema_dict: dict | None = None) -> dict:
     schema_path = settings.schema_path
     if schema_path.exists():
         with open(schema_path) as f:
-            _schema_cache = yaml.safe_load(f)
+            _schema_cache = yaml.load(f, Loader=YamlLoader)
     else:
         _schema_cache = {"node_types": {}, "relation_types": {}, "aliases": {}}
     return _schema_cache
@@ -34,8 +37,31 @@ def _load_schema(schema_dict: dict | None = None) -> dict:
 
 def reset_schema_cache() -> None:
     """Clear the schema cache (for tests)."""
-    global _schema_cache
+    global _schema_cache, _alias_index_cache
     _schema_cache = None
+    _alias_index_cache = None
+
+
+def _build_alias_index(schema: dict) -> dict[str, str]:
+    """Map lowercased alias → canonical name. The first alias listed wins on collisions."""
+    index: dict[str, str] = {}
+    for alias, canonical in (schema.get("aliases") or {}).items():
+        index.setdefault(alias.lower(), canonical)
+    return index
+
+
+def _alias_index(schema_dict: dict | None) -> dict[str, str]:
+    """Alias index for the given schema; built once for the default schema.
+
+    A caller-passed schema dict is indexed on every call, so edits to it are
+    always seen.
+    """
+    global _alias_index_cache
+    if schema_dict is not None:
+        return _build_alias_index(schema_dict)
+    if _alias_index_cache is None:
+        _alias_index_cache = _build_alias_index(_load_schema())
+    return _alias_index_cache
 
 
 def normalize_entity(name: str, schema_dict: dict | None = None) -> str:
@@ -48,16 +74,8 @@ def normalize_entity(name: str, schema_dict: dict | None = None) -> str:
     Returns:
         Canonical name if alias found, otherwise original name.
     """
-    schema = _load_schema(schema_dict)
-    aliases = schema.get("aliases", {})
-
     # Case-insensitive alias lookup
-    name_lower = name.lower()
-    for alias, canonical in aliases.items():
-        if alias.lower() == name_lower:
-            return canonical
-
-    return name
+    return _alias_index(schema_dict).get(name.lower(), name)
 
 
 def validate_entity(name: str, entity_type: str, schema_dict: dict | None = None) -> bool:
@@ -0,0 +1,79 @@
+"""Persistent exact-match cache for LLM responses."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path
+
+from litgraph.fileio import atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+# Entries older than this are treated as misses and removed on read
+DEFAULT_MAX_AGE = 30 * 24 * 3600.0
+
+
+class ResponseCache:
+    """On-disk LLM response cache keyed by SHA-256 of the full request.
+
+    Each entry is a text file under cache_dir named by its key, so re-running an
+    analysis with an identical model and prompts costs a file read instead of an
+    LLM call. Entries expire after max_age seconds so the directory does not
+    grow without bound across model and prompt revisions.
+
+    Args:
+        cache_dir: Directory holding cache entries (created on first write).
+        max_age: Seconds an entry stays valid; None keeps entries forever.
+    """
+
+    def __init__(self, cache_dir: Path, max_age: float | None = DEFAULT_MAX_AGE):
+        self.cache_dir = Path(cache_dir)
+        self.max_age = max_age
+
+    @staticmethod
+    def key(model: str, system_prompt: str | None, prompt: str, **extra) -> str:
+        """Return the cache key for a request.
+
+        Args:
+            model: Resolved model name (not "best"/"cheap"), so switching models misses.
+            system_prompt: System prompt, if any.
+            prompt: User prompt.
+            **extra: Additional values that must match for a hit (e.g. questions_version).
+        """
+        payload = json.dumps(
+            {"model": model, "system": system_prompt, "prompt": prompt, **extra},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.txt"
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response, or None on a miss or an expired entry."""
+        path = self._path(key)
+        try:
+            if self.max_age is not None and time.time() - path.stat().st_mtime > self.max_age:
+                path.unlink(missing_ok=True)
+                return None
+            return path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning("Failed to read LLM cache entry %s: %s", key, e)
+            return None
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response. Empty responses are not cached."""
+        if not response:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(path, response)
+        except OSError as e:
+            logger.warning("Failed to write LLM cache entry %s: %s", key, e)
@@ -3,23 +3,51 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
+import threading
+import weakref
+from typing import TYPE_CHECKING
 
 import httpx
-import anthropic
-from openai import OpenAI
 
 from litgraph.retry import with_retry
 from litgraph.settings import get_settings
 
+# The SDKs take ~0.5s each to import and only one is needed per mode, so they
+# are imported when their client is first created.
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Callable
+
+    import anthropic
+    from openai import AsyncOpenAI, OpenAI
+
+    from litgraph.settings import LLMConfig, Settings
+
 logger = logging.getLogger(__name__)
 
 # Client singletons
 _anthropic_client: anthropic.Anthropic | None = None
 _httpx_client: httpx.Client | None = None
+# One AsyncClient per event loop: its connection pool is bound to the loop it runs on
+_async_httpx_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
 _openai_client: OpenAI | None = None
+_async_openai_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI] = (
+    weakref.WeakKeyDictionary()
+)
+# Parked _close_at_loop_shutdown generators per loop; the loop only holds them weakly
+_loop_closers: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, list[AsyncGenerator[None, None]]
+] = weakref.WeakKeyDictionary()
 _lite_warned: bool = False
 _using_oauth: bool = False
+# Guards lazy singleton creation when complete() runs on worker threads
+_client_lock = threading.Lock()
+
+# (config, {"best": ..., "cheap": ...}) for the LLMConfig last seen by _model_name
+_model_names: tuple[LLMConfig, dict[str, str]] | None = None
 
 # Anthropic API settings
 ANTHROPIC_API_URL = "https://api.anthropic.com/v1/messages"
@@ -30,57 +58,137 @@ OAUTH_BETA_HEADER = "oauth-2025-04-20"
 def _get_httpx_client() -> httpx.Client:
     """Lazy-initialize the httpx client singleton for OAuth requests."""
     global _httpx_client
-    if _httpx_client is None:
-        _httpx_client = httpx.Client(timeout=120.0)
+    with _client_lock:
+        if _httpx_client is None:
+            _httpx_client = httpx.Client(timeout=120.0)
     return _httpx_client
 
 
-def _get_anthropic_client() -> anthropic.Anthropic:
+async def _close_at_loop_shutdown(
+    aclose: Callable[[], Awaitable[None]],
+) -> AsyncGenerator[None, None]:
+    """Stay parked until the owning loop finalizes async generators, then close a client.
+
+    asyncio.run() calls loop.shutdown_asyncgens() on exit, so the client is
+    closed on its own loop; reset_client() finalizes loops that are still open.
+    """
+    try:
+        yield
+    finally:
+        await aclose()
+
+
+async def _close_with_loop(
+    loop: asyncio.AbstractEventLoop, aclose: Callable[[], Awaitable[None]]
+) -> None:
+    """Register a per-loop client to be closed when its loop shuts down."""
+    closer = _close_at_loop_shutdown(aclose)
+    _loop_closers.setdefault(loop, []).append(closer)
+    await closer.__anext__()
+
+
+async def _get_async_httpx_client() -> httpx.AsyncClient:
+    """Lazy-initialize the AsyncClient for OAuth requests on the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_httpx_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            timeout=120.0,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+        _async_httpx_clients[loop] = client
+        await _close_with_loop(loop, client.aclose)
+    return client
+
+
+def _get_anthropic_client(llm: LLMConfig) -> anthropic.Anthropic:
     """Lazy-initialize the Anthropic SDK client singleton (for API key auth)."""
     global _anthropic_client
-    if _anthropic_client is None:
-        settings = get_settings()
-        token = settings.llm.api_key
+    with _client_lock:
+        if _anthropic_client is None:
+            token = llm.api_key
 
-        if not token:
-            raise ValueError(
-                "Anthropic API key not configured. Set ANTHROPIC_OAUTH_TOKEN or LITGRAPH_ANTHROPIC_API_KEY."
-            )
+            if not token:
+                raise ValueError(
+                    "Anthropic API key not configured. Set ANTHROPIC_OAUTH_TOKEN or LITGRAPH_ANTHROPIC_API_KEY."
+                )
 
-        logger.debug("Using standard API key with Anthropic SDK")
-        _anthropic_client = anthropic.Anthropic(api_key=token)
+            import anthropic
+
+            logger.debug("Using standard API key with Anthropic SDK")
+            _anthropic_client = anthropic.Anthropic(api_key=token)
 
     return _anthropic_client
 
 
-def _get_openai_client() -> OpenAI:
+def _get_openai_client(llm: LLMConfig) -> OpenAI:
     """Lazy-initialize the OpenAI client singleton (for Lite mode / Ollama)."""
     global _openai_client
-    if _openai_client is None:
-        settings = get_settings()
-        _openai_client = OpenAI(
-            base_url=settings.llm.base_url,
-            api_key=settings.llm.api_key,
-        )
+    with _client_lock:
+        if _openai_client is None:
+            from openai import OpenAI
+
+            _openai_client = OpenAI(
+                base_url=llm.base_url,
+                api_key=llm.api_key,
+            )
     return _openai_client
 
 
+async def _get_async_openai_client(llm: LLMConfig) -> AsyncOpenAI:
+    """Lazy-initialize the AsyncOpenAI client (Lite mode) on the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_openai_clients.get(loop)
+    if client is None:
+        from openai import AsyncOpenAI
+
+        client = AsyncOpenAI(base_url=llm.base_url, api_key=llm.api_key)
+        _async_openai_clients[loop] = client
+        await _close_with_loop(loop, client.close)
+    return client
+
+
+async def _finalize(closer: AsyncGenerator[None, None]) -> None:
+    """Resume a parked closer into its finally block."""
+    await closer.aclose()
+
+
+def _close_async_clients() -> None:
+    """Close per-loop async clients on their own loops.
+
+    Loops that already closed ran their closers in shutdown_asyncgens(); a loop
+    running in another thread (or this one) gets the close scheduled on it.
+    """
+    for loop, closers in list(_loop_closers.items()):
+        if loop.is_closed():
+            continue
+        for closer in closers:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(_finalize(closer), loop)
+            else:
+                loop.run_until_complete(_finalize(closer))
+    _loop_closers.clear()
+
+
 def reset_client() -> None:
     """Reset the client singletons (for tests)."""
-    global _anthropic_client, _httpx_client, _openai_client, _lite_warned, _using_oauth
+    global _anthropic_client, _httpx_client, _openai_client, _lite_warned, _using_oauth, _model_names
     _anthropic_client = None
     if _httpx_client is not None:
         _httpx_client.close()
         _httpx_client = None
+    _close_async_clients()
+    _async_httpx_clients.clear()
+    _async_openai_clients.clear()
     _openai_client = None
     _lite_warned = False
     _using_oauth = False
+    _model_names = None
 
 
-def _maybe_warn_lite() -> None:
+def _maybe_warn_lite(settings: Settings) -> None:
     """Log a warning on first call in Lite mode."""
     global _lite_warned
-    settings = get_settings()
     if settings.mode == "lite" and not _lite_warned:
         logger.warning(
             "Lite mode: best_model and cheap_model point to the same model (%s), "
@@ -90,8 +198,23 @@ def _maybe_warn_lite() -> None:
         _lite_warned = True
 
 
-def _complete_anthropic_oauth(prompt: str, system_prompt: str | None, model: str) -> str:
-    """Call Anthropic API with OAuth token using httpx directly.
+def _model_name(llm: LLMConfig, model: str) -> str:
+    """Resolve "best"/"cheap" to the configured model name.
+
+    The mapping is built once per LLMConfig; a settings reload produces a new
+    config object and therefore a fresh mapping.
+    """
+    global _model_names
+    cached = _model_names
+    if cached is None or cached[0] is not llm:
+        cached = _model_names = (llm, {"best": llm.best_model, "cheap": llm.cheap_model})
+    return cached[1].get(model, llm.cheap_model)
+
+
+def _oauth_request(
+    llm: LLMConfig, prompt: str, system_prompt: str | None, model: str
+) -> tuple[dict, dict]:
+    """Build (headers, payload) for an Anthropic request authenticated with an OAuth token.
 
     OAuth tokens require:
     - Authorization: Bearer header
@@ -99,38 +222,31 @@ def _complete_anthropic_oauth(prompt: str, system_prompt: str | None, model: str
 
     See: https://deepwiki.com/sst/opencode-anthropic-auth
     """
-    settings = get_settings()
-    model_name = settings.llm.best_model if model == "best" else settings.llm.cheap_model
-    token = settings.llm.api_key
-
-    # Build request headers
     headers = {
-        "Authorization": f"Bearer {token}",
+        "Authorization": f"Bearer {llm.api_key}",
         "Content-Type": "application/json",
         "anthropic-version": ANTHROPIC_VERSION,
         "anthropic-beta": OAUTH_BETA_HEADER,
     }
 
-    # Build request payload
     payload = {
-        "model": model_name,
+        "model": _model_name(llm, model),
         "max_tokens": 4096,
         "messages": [{"role": "user", "content": prompt}],
     }
     if system_prompt:
         payload["system"] = system_prompt
 
-    # Make request
-    client = _get_httpx_client()
-    response = client.post(ANTHROPIC_API_URL, headers=headers, json=payload)
+    return headers, payload
 
-    # Handle errors
+
+def _oauth_response_text(response: httpx.Response) -> str:
+    """Raise on an error response, otherwise return the first text block."""
     if response.status_code != 200:
         error_data = response.json() if response.headers.get("content-type", "").startswith("application/json") else {}
         error_msg = error_data.get("error", {}).get("message", response.text)
         raise RuntimeError(f"Anthropic API error ({response.status_code}): {error_msg}")
 
-    # Extract text from response
     data = response.json()
     content = data.get("content", [])
     if content and len(content) > 0:
@@ -138,19 +254,39 @@ def _complete_anthropic_oauth(prompt: str, system_prompt: str | None, model: str
     return ""
 
 
-def _complete_anthropic_sdk(prompt: str, system_prompt: str | None, model: str) -> str:
-    """Call Anthropic API with standard API key using the SDK."""
-    settings = get_settings()
-    model_name = settings.llm.best_model if model == "best" else settings.llm.cheap_model
+def _complete_anthropic_oauth(
+    llm: LLMConfig, prompt: str, system_prompt: str | None, model: str
+) -> str:
+    """Call Anthropic API with OAuth token using httpx directly."""
+    headers, payload = _oauth_request(llm, prompt, system_prompt, model)
+    client = _get_httpx_client()
+    response = client.post(ANTHROPIC_API_URL, headers=headers, json=payload)
+    return _oauth_response_text(response)
+
+
+@with_retry
+async def _acomplete_anthropic_oauth(
+    llm: LLMConfig, prompt: str, system_prompt: str | None, model: str
+) -> str:
+    """Async variant of _complete_anthropic_oauth for calls made from an event loop."""
+    headers, payload = _oauth_request(llm, prompt, system_prompt, model)
+    client = await _get_async_httpx_client()
+    response = await client.post(ANTHROPIC_API_URL, headers=headers, json=payload)
+    return _oauth_response_text(response)
+
 
-    client = _get_anthropic_client()
+def _complete_anthropic_sdk(
+    llm: LLMConfig, prompt: str, system_prompt: str | None, model: str
+) -> str:
+    """Call Anthropic API with standard API key using the SDK."""
+    client = _get_anthropic_client(llm)
 
     # Build messages
     messages = [{"role": "user", "content": prompt}]
 
     # Call Anthropic API
     kwargs = {
-        "model": model_name,
+        "model": _model_name(llm, model),
         "max_tokens": 4096,
         "messages": messages,
     }
@@ -166,35 +302,51 @@ def _complete_anthropic_sdk(prompt: str, system_prompt: str | None, model: str)
     return ""
 
 
-def _complete_anthropic(prompt: str, system_prompt: str | None, model: str) -> str:
+def _complete_anthropic(
+    llm: LLMConfig, prompt: str, system_prompt: str | None, model: str
+) -> str:
     """Call Anthropic API directly.
 
     Uses httpx for OAuth tokens, SDK for standard API keys.
     """
-    settings = get_settings()
-
-    if settings.llm.is_oauth_token:
+    if llm.is_oauth_token:
         logger.debug("Using OAuth token with httpx client")
-        return _complete_anthropic_oauth(prompt, system_prompt, model)
+        return _complete_anthropic_oauth(llm, prompt, system_prompt, model)
     else:
         logger.debug("Using standard API key with Anthropic SDK")
-        return _complete_anthropic_sdk(prompt, system_prompt, model)
-
+        return _complete_anthropic_sdk(llm, prompt, system_prompt, model)
 
-def _complete_openai(prompt: str, system_prompt: str | None, model: str) -> str:
-    """Call OpenAI-compatible API (Ollama)."""
-    settings = get_settings()
-    model_name = settings.llm.best_model if model == "best" else settings.llm.cheap_model
 
+def _openai_messages(prompt: str, system_prompt: str | None) -> list[dict]:
+    """Build the chat messages list for OpenAI-compatible APIs."""
     messages = []
     if system_prompt:
         messages.append({"role": "system", "content": system_prompt})
     messages.append({"role": "user", "content": prompt})
+    return messages
 
-    client = _get_openai_client()
+
+def _complete_openai(
+    llm: LLMConfig, prompt: str, system_prompt: str | None, model: str
+) -> str:
+    """Call OpenAI-compatible API (Ollama)."""
+    client = _get_openai_client(llm)
     response = client.chat.completions.create(
-        model=model_name,
-        messages=messages,
+        model=_model_name(llm, model),
+        messages=_openai_messages(prompt, system_prompt),
+    )
+    return response.choices[0].message.content
+
+
+@with_retry
+async def _acomplete_openai(
+    llm: LLMConfig, prompt: str, system_prompt: str | None, model: str
+) -> str:
+    """Async variant of _complete_openai for calls made from an event loop."""
+    client = await _get_async_openai_client(llm)
+    response = await client.chat.completions.create(
+        model=_model_name(llm, model),
+        messages=_openai_messages(prompt, system_prompt),
     )
     return response.choices[0].message.content
 
@@ -211,59 +363,84 @@ def complete(prompt: str, system_prompt: str | None = None, model: str = "best")
     Returns:
         LLM response text.
     """
-    _maybe_warn_lite()
     settings = get_settings()
+    _maybe_warn_lite(settings)
+
+    if settings.mode == "lite":
+        return _complete_openai(settings.llm, prompt, system_prompt, model)
+    return _complete_anthropic(settings.llm, prompt, system_prompt, model)
 
+
+async def _acomplete(prompt: str, system_prompt: str | None = None, model: str = "best") -> str:
+    """Async LLM completion for callers already on an event loop.
+
+    Lite mode (AsyncOpenAI) and the Anthropic OAuth path (httpx) are awaited
+    directly; the Anthropic SDK path runs complete() in a worker thread.
+    """
+    settings = get_settings()
     if settings.mode == "lite":
-        return _complete_openai(prompt, system_prompt, model)
+        acall = _acomplete_openai
+    elif settings.llm.is_oauth_token:
+        acall = _acomplete_anthropic_oauth
     else:
-        return _complete_anthropic(prompt, system_prompt, model)
+        return await asyncio.to_thread(complete, prompt, system_prompt, model)
 
+    _maybe_warn_lite(settings)
+    return await acall(settings.llm, prompt, system_prompt, model)
 
-async def best_model_complete(
-    prompt: str,
-    system_prompt: str | None = None,
-    history_messages: list | None = None,
-    **kwargs,
-) -> str:
-    """Async wrapper for nano-graphrag — uses best model.
 
-    Handles the hashing_kv caching kwarg from nano-graphrag.
-    Uses asyncio.to_thread to wrap sync API call.
+def _kv_cache_key(model_name: str, prompt: str, system_prompt: str | None) -> str:
+    """Short fixed-size key for nano-graphrag's hashing_kv LLM cache.
+
+    Fields are NUL-separated so different (system, prompt) splits cannot collide.
     """
-    # Handle nano-graphrag caching
-    hashing_kv = kwargs.get("hashing_kv")
+    h = hashlib.blake2b(digest_size=16)
+    for part in (model_name, system_prompt or "", prompt):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+async def _cached_model_complete(
+    model: str,
+    prompt: str,
+    system_prompt: str | None,
+    hashing_kv,
+) -> str:
+    """Shared body of the nano-graphrag wrappers: hashing_kv lookup → complete() → store."""
+    cache_key = None
     if hashing_kv is not None:
-        cache_key = f"{prompt}_{system_prompt}"
+        cache_key = _kv_cache_key(_model_name(get_settings().llm, model), prompt, system_prompt)
         cached = await hashing_kv.get_by_id(cache_key)
         if cached and "return" in cached:
             return cached["return"]
 
-    result = await asyncio.to_thread(complete, prompt, system_prompt, "best")
+    result = await _acomplete(prompt, system_prompt, model)
 
-    if hashing_kv is not None:
+    if cache_key is not None:
         await hashing_kv.upsert({cache_key: {"return": result}})
 
     return result
 
 
-async def cheap_model_complete(
+async def best_model_complete(
     prompt: str,
     system_prompt: str | None = None,
     history_messages: list | None = None,
     **kwargs,
 ) -> str:
-    """Async wrapper for nano-graphrag — uses cheap model."""
-    hashing_kv = kwargs.get("hashing_kv")
-    if hashing_kv is not None:
-        cache_key = f"{prompt}_{system_prompt}"
-        cached = await hashing_kv.get_by_id(cache_key)
-        if cached and "return" in cached:
-            return cached["return"]
+    """Async wrapper for nano-graphrag — uses best model.
 
-    result = await asyncio.to_thread(complete, prompt, system_prompt, "cheap")
+    Handles the hashing_kv caching kwarg from nano-graphrag.
+    """
+    return await _cached_model_complete("best", prompt, system_prompt, kwargs.get("hashing_kv"))
 
-    if hashing_kv is not None:
-        await hashing_kv.upsert({cache_key: {"return": result}})
 
-    return result
+async def cheap_model_complete(
+    prompt: str,
+    system_prompt: str | None = None,
+    history_messages: list | None = None,
+    **kwargs,
+) -> str:
+    """Async wrapper for nano-graphrag — uses cheap model."""
+    return await _cached_model_complete("cheap", prompt, system_prompt, kwargs.get("hashing_kv"))
@@ -0,0 +1,75 @@
+"""Local SentenceTransformer embeddings — lazy model singleton and batched encoding."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from litgraph.settings import get_settings
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+logger = logging.getLogger(__name__)
+
+# Loaded models keyed by name; loading one takes seconds, so it happens once per process
+_models: dict[str, SentenceTransformer] = {}
+_model_lock = threading.Lock()
+# encode() on a shared model is not thread-safe (the fast tokenizer raises
+# "Already borrowed", and concurrent forward passes oversubscribe torch threads),
+# so calls from to_thread workers run one at a time
+_encode_lock = threading.Lock()
+
+
+def get_embedding_model(model_name: str | None = None) -> SentenceTransformer:
+    """Lazy-load a SentenceTransformer model (default: settings.embedding_model).
+
+    SentenceTransformer selects CUDA/MPS automatically when available.
+    """
+    if model_name is None:
+        model_name = get_settings().embedding_model
+    with _model_lock:
+        model = _models.get(model_name)
+        if model is None:
+            from sentence_transformers import SentenceTransformer
+
+            logger.debug("Loading embedding model %s", model_name)
+            model = SentenceTransformer(model_name)
+            _models[model_name] = model
+    return model
+
+
+def embed_texts(
+    texts: list[str],
+    model_name: str | None = None,
+    batch_size: int = 64,
+) -> np.ndarray:
+    """Embed texts in batches with one encode() call, serialized across threads.
+
+    Args:
+        texts: Texts to embed.
+        model_name: Embedding model; defaults to settings.embedding_model.
+        batch_size: Texts per forward pass.
+
+    Returns:
+        Array of shape (len(texts), dim). Rows are L2-normalized, so cosine
+        similarity reduces to a dot product.
+    """
+    model = get_embedding_model(model_name)
+    with _encode_lock:
+        return model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+
+
+def reset_embedding_model() -> None:
+    """Drop loaded embedding models (for tests)."""
+    with _model_lock:
+        _models.clear()
@@ -2,15 +2,54 @@
 
 from __future__ import annotations
 
+import functools
+import threading
 from pathlib import Path
+from typing import Any
 
 import yaml
-from jinja2 import BaseLoader, Environment, StrictUndefined
+from jinja2 import BaseLoader, Environment, StrictUndefined, Template
 
 from litgraph.settings import get_settings
+from litgraph.yamlio import YamlLoader
 
 _jinja_env = Environment(loader=BaseLoader(), undefined=StrictUndefined)
 
+# Parsed YAML per path, reused while the file content is unchanged. The file is
+# still read on every call (it is small); only the YAML parse is skipped.
+_yaml_cache: dict[str, tuple[bytes, Any]] = {}
+_yaml_cache_lock = threading.Lock()
+
+
+def load_prompt_yaml(path: Path) -> Any:
+    """Parse a prompt YAML file, returning the cached result if its content is unchanged.
+
+    Callers must treat the returned object as read-only.
+    """
+    raw = Path(path).read_bytes()
+    key = str(path)
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(key)
+    if cached is not None and cached[0] == raw:
+        return cached[1]
+    data = yaml.load(raw, Loader=YamlLoader)
+    with _yaml_cache_lock:
+        _yaml_cache[key] = (raw, data)
+    return data
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_template(source: str) -> Template:
+    """Compile a Jinja2 template once per distinct source text."""
+    return _jinja_env.from_string(source)
+
+
+def reset_prompt_cache() -> None:
+    """Drop parsed YAML and compiled templates (for tests)."""
+    with _yaml_cache_lock:
+        _yaml_cache.clear()
+    _compile_template.cache_clear()
+
 
 def load_prompt(name: str, **kwargs) -> tuple[str, str]:
     """Load a prompt YAML and render the template with Jinja2.
@@ -37,12 +76,11 @@ def load_prompt_from_path(yaml_path: Path, **kwargs) -> tuple[str, str]:
     Returns:
         (system_prompt, user_prompt) tuple.
     """
-    with open(yaml_path) as f:
-        data = yaml.safe_load(f)
+    data = load_prompt_yaml(yaml_path)
 
     system_prompt = data["system"].strip()
 
-    template = _jinja_env.from_string(data["template"])
+    template = _compile_template(data["template"])
     user_prompt = template.render(**kwargs).strip()
 
     return system_prompt, user_prompt
@@ -58,10 +96,9 @@ def load_questions(questions_path: Path | None = None) -> list[dict]:
         settings = get_settings()
         questions_path = settings.questions_path
 
-    with open(questions_path) as f:
-        data = yaml.safe_load(f)
+    data = load_prompt_yaml(questions_path)
 
-    return data["questions"]
+    return [dict(q) for q in data["questions"]]
 
 
 def get_questions_version(questions_path: Path | None = None) -> int:
@@ -70,15 +107,11 @@ def get_questions_version(questions_path: Path | None = None) -> int:
         settings = get_settings()
         questions_path = settings.questions_path
 
-    with open(questions_path) as f:
-        data = yaml.safe_load(f)
+    data = load_prompt_yaml(questions_path)
 
     return data.get("version", 1)
 
 
 def format_questions_block(questions: list[dict]) -> str:
     """Format a list of questions into a numbered block for prompt inclusion."""
-    lines = []
-    for i, q in enumerate(questions, 1):
-        lines.append(f"{i}. {q['text']}")
-    return "\n".join(lines)
+    return "\n".join([f"{i}. {q['text']}" for i, q in enumerate(questions, 1)])
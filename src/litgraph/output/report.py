@@ -6,6 +6,7 @@ import logging
 from datetime import datetime, timezone
 from pathlib import Path
 
+from litgraph.fileio import atomic_write_text
 from litgraph.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -43,6 +44,6 @@ def save_report(
         f"timestamp: {timestamp} -->\n\n"
     )
 
-    path.write_text(header + content, encoding="utf-8")
+    atomic_write_text(path, header + content)
     logger.info("Report saved: %s", path)
     return path
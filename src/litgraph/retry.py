@@ -6,68 +6,84 @@ import asyncio
 import functools
 import inspect
 import logging
+import random
+import threading
 import time
 from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from litgraph.settings import RetryConfig
 
 logger = logging.getLogger(__name__)
 
 
+def _retry_wait(retry: RetryConfig, attempt: int, rng: random.Random, name: str, exc: Exception) -> float | None:
+    """Seconds to wait before the next attempt, or None once retries are exhausted."""
+    if attempt >= retry.max_retries:
+        return None
+    wait = rng.uniform(0, min(retry.backoff_cap, retry.backoff_base ** attempt))
+    logger.warning(
+        "Retry %d/%d for %s after %.1fs: %s",
+        attempt + 1, retry.max_retries, name, wait, exc,
+    )
+    return wait
+
+
 def with_retry(func):
     """Decorator: exponential backoff retry. Handles both sync and async functions.
 
-    Reads max_retries and backoff_base from Settings at call time.
+    Reads max_retries, backoff_base and backoff_cap from Settings on the first
+    failure of a call, so successful calls never touch Settings.
+    Waits use "full jitter" — uniform(0, min(cap, base ** attempt)) — so
+    callers that fail together do not retry in lockstep.
     """
+    rng = random.Random()
+
     if inspect.iscoroutinefunction(func):
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
-            from litgraph.settings import get_settings
-            settings = get_settings()
-            max_retries = settings.retry.max_retries
-            backoff_base = settings.retry.backoff_base
-
-            last_exc = None
-            for attempt in range(max_retries + 1):
+            retry = None
+            attempt = 0
+            while True:
                 try:
                     return await func(*args, **kwargs)
                 except Exception as exc:
-                    last_exc = exc
-                    if attempt < max_retries:
-                        wait = backoff_base ** attempt
-                        logger.warning(
-                            "Retry %d/%d for %s after %.1fs: %s",
-                            attempt + 1, max_retries, func.__name__, wait, exc,
-                        )
-                        await asyncio.sleep(wait)
-            raise last_exc
+                    if retry is None:
+                        from litgraph.settings import get_settings
+                        retry = get_settings().retry
+                    wait = _retry_wait(retry, attempt, rng, func.__name__, exc)
+                    if wait is None:
+                        raise
+                await asyncio.sleep(wait)
+                attempt += 1
         return async_wrapper
     else:
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            from litgraph.settings import get_settings
-            settings = get_settings()
-            max_retries = settings.retry.max_retries
-            backoff_base = settings.retry.backoff_base
-
-            last_exc = None
-            for attempt in range(max_retries + 1):
+            retry = None
+            attempt = 0
+            while True:
                 try:
                     return func(*args, **kwargs)
                 except Exception as exc:
-                    last_exc = exc
-                    if attempt < max_retries:
-                        wait = backoff_base ** attempt
-                        logger.warning(
-                            "Retry %d/%d for %s after %.1fs: %s",
-                            attempt + 1, max_retries, func.__name__, wait, exc,
-                        )
-                        time.sleep(wait)
-            raise last_exc
+                    if retry is None:
+                        from litgraph.settings import get_settings
+                        retry = get_settings().retry
+                    wait = _retry_wait(retry, attempt, rng, func.__name__, exc)
+                    if wait is None:
+                        raise
+                time.sleep(wait)
+                attempt += 1
         return sync_wrapper
 
 
 class RateLimiter:
     """Sliding-window rate limiter.
 
+    Safe to share between threads and coroutines: the window check and the
+    slot reservation happen under one lock, and waiting happens outside it.
+
     Args:
         max_calls: Maximum number of calls per window.
         period: Window size in seconds.
@@ -79,6 +95,7 @@ class RateLimiter:
         self.max_calls = max_calls or settings.rate_limit.search_max_calls
         self.period = period or settings.rate_limit.search_period
         self._timestamps: deque[float] = deque()
+        self._lock = threading.Lock()
 
     def _prune(self, now: float) -> None:
         """Remove timestamps outside the current window."""
@@ -86,29 +103,35 @@ class RateLimiter:
         while self._timestamps and self._timestamps[0] < cutoff:
             self._timestamps.popleft()
 
-    def acquire_sync(self) -> None:
-        """Block (sync) until a call slot is available."""
-        while True:
+    def _try_acquire(self) -> float | None:
+        """Reserve a call slot if one is free.
+
+        Returns:
+            None if a slot was reserved, otherwise seconds until the oldest
+            entry leaves the window.
+        """
+        with self._lock:
             now = time.monotonic()
             self._prune(now)
             if len(self._timestamps) < self.max_calls:
                 self._timestamps.append(now)
+                return None
+            return max(self._timestamps[0] + self.period - now, 0.0)
+
+    def acquire_sync(self) -> None:
+        """Block (sync) until a call slot is available."""
+        while True:
+            wait = self._try_acquire()
+            if wait is None:
                 return
-            # Wait until the oldest entry expires
-            wait = self._timestamps[0] + self.period - now
-            if wait > 0:
-                logger.debug("Rate limiter: waiting %.1fs", wait)
-                time.sleep(wait)
+            logger.debug("Rate limiter: waiting %.1fs", wait)
+            time.sleep(wait)
 
     async def acquire(self) -> None:
         """Block (async) until a call slot is available."""
         while True:
-            now = time.monotonic()
-            self._prune(now)
-            if len(self._timestamps) < self.max_calls:
-                self._timestamps.append(now)
+            wait = self._try_acquire()
+            if wait is None:
                 return
-            wait = self._timestamps[0] + self.period - now
-            if wait > 0:
-                logger.debug("Rate limiter: waiting %.1fs", wait)
-                await asyncio.sleep(wait)
+            logger.debug("Rate limiter: waiting %.1fs", wait)
+            await asyncio.sleep(wait)
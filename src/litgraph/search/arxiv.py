@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import tempfile
 from pathlib import Path
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,7 +16,7 @@ def search_arxiv(keywords: list[str], max_results: int = 50) -> list[dict]:
 
     Args:
         keywords: List of search keywords.
-        max_results: Maximum results per keyword.
+        max_results: Maximum total results across all keywords.
 
     Returns:
         List of paper dicts with standardized fields.
@@ -26,31 +27,46 @@ def search_arxiv(keywords: list[str], max_results: int = 50) -> list[dict]:
 
     with tempfile.TemporaryDirectory() as tmpdir:
         for kw in keywords:
+            # Only ask each keyword for what the budget still allows
+            remaining = max_results - len(all_papers)
+            if remaining <= 0:
+                break
             outfile = Path(tmpdir) / f"{kw.replace(' ', '_')}.jsonl"
             try:
-                get_and_dump_arxiv_papers(kw, output_filepath=str(outfile))
+                get_and_dump_arxiv_papers(kw, output_filepath=str(outfile), max_results=remaining)
             except Exception as e:
                 logger.warning("Arxiv search failed for '%s': %s", kw, e)
                 continue
 
-            if outfile.exists():
-                with open(outfile) as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            raw = json.loads(line)
-                            paper = _normalize_arxiv_paper(raw)
-                            if paper:
-                                all_papers.append(paper)
-                        except json.JSONDecodeError:
-                            continue
-
-            if len(all_papers) >= max_results:
-                break
+            all_papers.extend(_read_arxiv_jsonl(outfile, limit=remaining))
+
+    return all_papers
+
 
-    return all_papers[:max_results]
+def _read_arxiv_jsonl(path: Path, limit: int | None = None) -> list[dict]:
+    """Parse a paperscraper JSONL dump into normalized papers.
+
+    Blank and malformed lines are skipped; a missing file yields []. Reading
+    stops once `limit` papers have been collected.
+    """
+    papers = []
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return papers
+    with f:
+        for line in f:
+            # orjson accepts the surrounding whitespace; blank lines fail to parse
+            try:
+                raw = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            paper = _normalize_arxiv_paper(raw)
+            if paper:
+                papers.append(paper)
+                if limit is not None and len(papers) >= limit:
+                    break
+    return papers
 
 
 def _normalize_arxiv_paper(raw: dict) -> dict | None:
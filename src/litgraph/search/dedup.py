@@ -3,19 +3,38 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import re
 from pathlib import Path
 
+import orjson
+
+from litgraph.fileio import atomic_write_bytes
+
+
+# ASCII characters removed by the title normalization: everything except
+# word characters ([A-Za-z0-9_]) and whitespace, i.e. what [^\w\s] matches
+_ASCII_STRIP_TABLE = str.maketrans("", "", "".join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c == "_" or c.isspace())
+))
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Fields refreshed on an already-indexed paper when a new search reports them
+_META_FIELDS = ("citations", "doi", "pdf_url")
+
 
 def _title_hash(title: str) -> str:
     """Normalize title → SHA256[:16] for dedup fallback.
 
     Steps: lowercase → strip punctuation → collapse whitespace → SHA256[:16].
+    ASCII titles (the common case) skip the regexes; the result is identical.
     """
     t = title.lower()
-    t = re.sub(r"[^\w\s]", "", t)
-    t = re.sub(r"\s+", " ", t).strip()
+    if t.isascii():
+        t = " ".join(t.translate(_ASCII_STRIP_TABLE).split())
+    else:
+        t = _NON_WORD_RE.sub("", t)
+        t = _WHITESPACE_RE.sub(" ", t).strip()
     return hashlib.sha256(t.encode("utf-8")).hexdigest()[:16]
 
 
@@ -38,15 +57,24 @@ def dedup_key(paper: dict) -> str:
 
 def dedup_paper_list(papers: list[dict]) -> list[dict]:
     """Deduplicate a list of papers within a single run. Keeps first occurrence."""
-    seen = set()
-    result = []
+    # dict preserves insertion order, so it is both the seen-set and the result
+    unique: dict[str, dict] = {}
     for p in papers:
         key = dedup_key(p)
-        if key not in seen:
-            seen.add(key)
+        if key not in unique:
             p["dedup_key"] = key
-            result.append(p)
-    return result
+            unique[key] = p
+    return list(unique.values())
+
+
+def load_index(index_path: Path) -> list[dict]:
+    """Load the paper index (index.json) as a list of paper dicts."""
+    return orjson.loads(Path(index_path).read_bytes())
+
+
+def save_index(papers: list[dict], index_path: Path) -> None:
+    """Write the paper index atomically (temp file + rename), 2-space indented."""
+    atomic_write_bytes(Path(index_path), orjson.dumps(papers, option=orjson.OPT_INDENT_2) + b"\n")
 
 
 def merge_into_index(
@@ -60,24 +88,22 @@ def merge_into_index(
     # Load existing index
     existing = {}
     if index_path.exists():
-        with open(index_path) as f:
-            data = json.load(f)
-            for entry in data:
-                key = entry.get("dedup_key", dedup_key(entry))
-                existing[key] = entry
+        for entry in load_index(index_path):
+            key = entry.get("dedup_key") or dedup_key(entry)
+            existing[key] = entry
 
     added = []
     updated = []
 
     for paper in new_papers:
-        key = paper.get("dedup_key", dedup_key(paper))
+        key = paper.get("dedup_key") or dedup_key(paper)
         paper["dedup_key"] = key
 
         if key in existing:
             # Update meta fields that may have changed
             old = existing[key]
             changed = False
-            for field in ("citations", "doi", "pdf_url"):
+            for field in _META_FIELDS:
                 new_val = paper.get(field)
                 if new_val is not None and new_val != old.get(field):
                     old[field] = new_val
@@ -88,9 +114,9 @@ def merge_into_index(
             existing[key] = paper
             added.append(paper)
 
-    # Write back
-    index_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(index_path, "w") as f:
-        json.dump(list(existing.values()), f, indent=2, ensure_ascii=False)
+    # Write back (an unchanged index is left as is)
+    if added or updated or not index_path.exists():
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        save_index(list(existing.values()), index_path)
 
     return added, updated
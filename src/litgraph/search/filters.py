@@ -7,6 +7,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Papers classified per LLM call when the relevance check is enabled
+_RELEVANCE_BATCH_SIZE = 10
+
 
 def filter_papers(
     papers: list[dict],
@@ -25,25 +28,58 @@ def filter_papers(
     Returns:
         Filtered list of papers.
     """
-    result = []
-
-    for paper in papers:
-        citations = paper.get("citations", 0) or 0
-        if citations < min_citations:
-            continue
+    result = [p for p in papers if (p.get("citations", 0) or 0) >= min_citations]
 
-        if use_llm_filter and keywords:
-            if not _llm_relevance_check(paper, keywords):
-                continue
+    if use_llm_filter and keywords:
+        candidates = result
+        result = []
+        for start in range(0, len(candidates), _RELEVANCE_BATCH_SIZE):
+            batch = candidates[start:start + _RELEVANCE_BATCH_SIZE]
+            flags = _llm_relevance_batch(batch, keywords)
+            result.extend(p for p, relevant in zip(batch, flags) if relevant)
 
+    for paper in result:
         paper["relevant"] = True
-        result.append(paper)
 
     logger.info("Filtered %d → %d papers (min_citations=%d, llm=%s)",
                 len(papers), len(result), min_citations, use_llm_filter)
     return result
 
 
+def _llm_relevance_batch(papers: list[dict], keywords: list[str]) -> list[bool]:
+    """Classify several papers with one LLM call.
+
+    Falls back to one _llm_relevance_check per paper if the call fails or the
+    answer does not contain exactly one flag per paper.
+    """
+    from litgraph.llm.client import complete
+    from litgraph.llm.prompts import load_prompt
+
+    if len(papers) == 1:
+        return [_llm_relevance_check(papers[0], keywords)]
+
+    topic = ", ".join(keywords)
+    try:
+        system, user = load_prompt(
+            "relevance_filter_batch",
+            topic=topic,
+            papers=[{"title": p.get("title", ""), "abstract": p.get("abstract", "")} for p in papers],
+        )
+        response = complete(user, system_prompt=system, model="cheap")
+        flags = json.loads(response).get("relevant")
+        if (
+            isinstance(flags, list)
+            and len(flags) == len(papers)
+            and all(isinstance(f, bool) for f in flags)
+        ):
+            return flags
+        logger.warning("LLM batch relevance answer is not %d booleans (%r); checking individually",
+                       len(papers), flags)
+    except Exception as e:
+        logger.warning("LLM batch relevance check failed: %s; checking individually", e)
+    return [_llm_relevance_check(p, keywords) for p in papers]
+
+
 def _llm_relevance_check(paper: dict, keywords: list[str]) -> bool:
     """Use LLM to check if a paper is relevant to the search keywords."""
     from litgraph.llm.client import complete
@@ -3,21 +3,45 @@
 from __future__ import annotations
 
 import logging
+import operator
+from typing import TYPE_CHECKING
 
 from litgraph.retry import RateLimiter
 
+if TYPE_CHECKING:
+    from semanticscholar import SemanticScholar
+
 logger = logging.getLogger(__name__)
 
 _rate_limiter: RateLimiter | None = None
+# Shared client so its HTTP connection pool survives across searches
+_client: SemanticScholar | None = None
+
+_SS_FIELD_NAMES = (
+    "title", "abstract", "year", "citationCount", "externalIds", "authors", "openAccessPdf",
+)
+# Fetches every field used by _normalize_ss_paper in one call
+_ss_fields = operator.attrgetter(*_SS_FIELD_NAMES)
 
 
 def _get_rate_limiter() -> RateLimiter:
+    """Lazy-initialize the Semantic Scholar rate limiter singleton."""
     global _rate_limiter
     if _rate_limiter is None:
         _rate_limiter = RateLimiter()
     return _rate_limiter
 
 
+def _get_client() -> SemanticScholar:
+    """Lazy-initialize the Semantic Scholar client singleton."""
+    global _client
+    if _client is None:
+        from semanticscholar import SemanticScholar
+
+        _client = SemanticScholar()
+    return _client
+
+
 def search_semantic_scholar(
     keywords: list[str],
     max_results: int = 50,
@@ -33,19 +57,20 @@ def search_semantic_scholar(
     Returns:
         List of paper dicts with standardized fields.
     """
-    from semanticscholar import SemanticScholar
-
-    sch = SemanticScholar()
+    sch = _get_client()
     limiter = _get_rate_limiter()
     all_papers = []
 
     for kw in keywords:
+        remaining = max_results - len(all_papers)
+        if remaining <= 0:
+            break
         limiter.acquire_sync()
         try:
             year_range = f"{year_from}-" if year_from else None
             results = sch.search_paper(
                 kw,
-                limit=min(max_results, 100),
+                limit=min(remaining, 100),
                 year=year_range,
                 fields=[
                     "title", "abstract", "authors", "year",
@@ -59,36 +84,42 @@ def search_semantic_scholar(
         if results is None:
             continue
 
+        # Iterating the paginated results past the first page issues further
+        # (un-rate-limited) requests, so stop as soon as the budget is filled
         for item in results:
             paper = _normalize_ss_paper(item)
             if paper:
                 all_papers.append(paper)
+                if len(all_papers) >= max_results:
+                    break
 
-        if len(all_papers) >= max_results:
-            break
-
-    return all_papers[:max_results]
+    return all_papers
 
 
 def _normalize_ss_paper(item) -> dict | None:
     """Normalize a Semantic Scholar result to standard format."""
-    title = getattr(item, "title", None) or ""
+    try:
+        title, abstract, year, citations, ext_ids, raw_authors, oaPdf = _ss_fields(item)
+    except AttributeError:
+        # Partial objects: missing fields count as None
+        title, abstract, year, citations, ext_ids, raw_authors, oaPdf = (
+            getattr(item, name, None) for name in _SS_FIELD_NAMES
+        )
+    title = title or ""
     if not title.strip():
         return None
 
-    ext_ids = getattr(item, "externalIds", {}) or {}
+    ext_ids = ext_ids or {}
     arxiv_id = ext_ids.get("ArXiv")
     doi = ext_ids.get("DOI")
 
     authors = []
-    raw_authors = getattr(item, "authors", []) or []
-    for a in raw_authors:
+    for a in raw_authors or ():
         name = getattr(a, "name", None) or (a.get("name") if isinstance(a, dict) else str(a))
         if name:
             authors.append(name)
 
     pdf_url = None
-    oaPdf = getattr(item, "openAccessPdf", None)
     if oaPdf and isinstance(oaPdf, dict):
         pdf_url = oaPdf.get("url")
 
@@ -100,9 +131,9 @@ def _normalize_ss_paper(item) -> dict | None:
         "doi": doi,
         "title": title.strip(),
         "authors": authors,
-        "year": getattr(item, "year", None),
-        "abstract": getattr(item, "abstract", "") or "",
+        "year": year,
+        "abstract": abstract or "",
         "source": "semantic_scholar",
-        "citations": getattr(item, "citationCount", 0) or 0,
+        "citations": citations or 0,
         "pdf_url": pdf_url,
     }
@@ -7,7 +7,9 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 import yaml
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
+
+from litgraph.yamlio import YamlLoader
 
 
 # OAuth token prefix for Anthropic subscription tokens
@@ -36,6 +38,7 @@ class LLMConfig:
 class RetryConfig:
     max_retries: int = 3
     backoff_base: float = 2.0
+    backoff_cap: float = 60.0
 
 
 @dataclass
@@ -50,6 +53,7 @@ class Settings:
     data_dir: Path = field(default_factory=lambda: Path("../DATA"))
     llm: LLMConfig = field(default_factory=LLMConfig)
     embedding_model: str = "all-MiniLM-L6-v2"
+    analyze_workers: int = 4
     retry: RetryConfig = field(default_factory=RetryConfig)
     rate_limit: RateLimitConfig = field(default_factory=RateLimitConfig)
     project_root: Path = field(default_factory=lambda: Path(__file__).resolve().parent.parent.parent)
@@ -67,6 +71,10 @@ class Settings:
 
 
 _settings: Settings | None = None
+# Parsed config.default.yaml per path, reused while (mtime, size) is unchanged
+_defaults_cache: dict[Path, tuple[tuple[int, int], dict]] = {}
+# Parsed .env per path, reused while (mtime, size) is unchanged
+_env_cache: dict[Path, tuple[tuple[int, int], dict[str, str]]] = {}
 
 
 def _resolve_data_dir(raw: str, project_root: Path) -> Path:
@@ -77,28 +85,73 @@ def _resolve_data_dir(raw: str, project_root: Path) -> Path:
     return (project_root / p).resolve()
 
 
-def get_settings(project_root: Path | None = None, force_reload: bool = False) -> Settings:
-    """Return the global Settings singleton, loading from .env + config.default.yaml."""
+def _load_defaults(path: Path) -> dict:
+    """Parse config.default.yaml, skipping the parse when the file is unchanged."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return {}
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _defaults_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(path) as f:
+        defaults = yaml.load(f, Loader=YamlLoader) or {}
+    _defaults_cache[path] = (stamp, defaults)
+    return defaults
+
+
+def _apply_env_file(path: Path) -> None:
+    """Load a .env file into os.environ (overriding), skipping the parse when unchanged.
+
+    Files using ${VAR} interpolation are re-read every time, since the expansion
+    depends on the current environment.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _env_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        values = cached[1]
+    else:
+        raw = dotenv_values(path, interpolate=False)
+        if any("$" in v for v in raw.values() if v is not None):
+            load_dotenv(path, override=True)
+            return
+        values = {k: v for k, v in raw.items() if v is not None}
+        _env_cache[path] = (stamp, values)
+    os.environ.update(values)
+
+
+def get_settings(
+    project_root: Path | None = None,
+    force_reload: bool = False,
+    mode: str | None = None,
+) -> Settings:
+    """Return the global Settings singleton, loading from .env + config.default.yaml.
+
+    Args:
+        project_root: Directory holding .env and config/. Defaults to the repo root.
+        force_reload: Rebuild the singleton even if already loaded.
+        mode: Explicit "pro"/"lite" override, taking precedence over LITGRAPH_MODE
+            without modifying os.environ. A loaded singleton in another mode is rebuilt.
+    """
     global _settings
-    if _settings is not None and not force_reload:
+    if _settings is not None and not force_reload and (mode is None or _settings.mode == mode):
         return _settings
 
     if project_root is None:
         project_root = Path(__file__).resolve().parent.parent.parent
 
     # Load .env from project root
-    env_path = project_root / ".env"
-    if env_path.exists():
-        load_dotenv(env_path, override=True)
+    _apply_env_file(project_root / ".env")
 
     # Load config.default.yaml
-    default_config_path = project_root / "config" / "config.default.yaml"
-    defaults = {}
-    if default_config_path.exists():
-        with open(default_config_path) as f:
-            defaults = yaml.safe_load(f) or {}
+    defaults = _load_defaults(project_root / "config" / "config.default.yaml")
 
-    mode = os.environ.get("LITGRAPH_MODE", "pro").lower()
+    mode = (mode or os.environ.get("LITGRAPH_MODE", "pro")).lower()
 
     # Build LLM config based on mode
     if mode == "lite":
@@ -126,6 +179,7 @@ def get_settings(project_root: Path | None = None, force_reload: bool = False) -
     retry = RetryConfig(
         max_retries=int(os.environ.get("LITGRAPH_MAX_RETRIES", "3")),
         backoff_base=float(os.environ.get("LITGRAPH_RETRY_BACKOFF_BASE", "2.0")),
+        backoff_cap=float(os.environ.get("LITGRAPH_RETRY_BACKOFF_CAP", "60.0")),
     )
 
     rate_limit = RateLimitConfig(
@@ -143,6 +197,7 @@ def get_settings(project_root: Path | None = None, force_reload: bool = False) -
         data_dir=data_dir,
         llm=llm,
         embedding_model=os.environ.get("LITGRAPH_EMBEDDING_MODEL", "all-MiniLM-L6-v2"),
+        analyze_workers=int(os.environ.get("LITGRAPH_ANALYZE_WORKERS", "4")),
         retry=retry,
         rate_limit=rate_limit,
         project_root=project_root,
@@ -0,0 +1,8 @@
+"""PyYAML loader/dumper choice: libyaml-backed when available, pure-Python otherwise."""
+
+from __future__ import annotations
+
+import yaml
+
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
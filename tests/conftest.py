@@ -2,40 +2,80 @@
 
 from __future__ import annotations
 
+import base64
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import networkx as nx
 import pytest
 
+# Two-page PDF generated with pymupdf (insert_text at 72pt from the left):
+#   page 1: "This is the first page of the paper." / "It discusses founda-"
+#   page 2: "tion models for single-cell analysis." / "The results show improvement."
+#           and a page number "2" at (300, 750)
+_PDF_BLOB = base64.b64decode(
+    b"JVBERi0xLjcKJcK1wrYKCjEgMCBvYmoKPDwvVHlwZS9DYXRhbG9nL1BhZ2VzIDIgMCBSPj4KZW5kb2JqCgoyIDAg"
+    b"b2JqCjw8L1R5cGUvUGFnZXMvQ291bnQgMi9LaWRzWzQgMCBSIDggMCBSXT4+CmVuZG9iagoKMyAwIG9iago8PC9G"
+    b"b250PDwvaGVsdiA1IDAgUj4+Pj4KZW5kb2JqCgo0IDAgb2JqCjw8L1R5cGUvUGFnZS9NZWRpYUJveFswIDAgNTk1"
+    b"IDg0Ml0vUm90YXRlIDAvUmVzb3VyY2VzIDMgMCBSL1BhcmVudCAyIDAgUi9Db250ZW50c1s2IDAgUiA3IDAgUl0+"
+    b"PgplbmRvYmoKCjUgMCBvYmoKPDwvVHlwZS9Gb250L1N1YnR5cGUvVHlwZTEvQmFzZUZvbnQvSGVsdmV0aWNhL0Vu"
+    b"Y29kaW5nL1dpbkFuc2lFbmNvZGluZz4+CmVuZG9iagoKNiAwIG9iago8PC9MZW5ndGggMTAxL0ZpbHRlci9GbGF0"
+    b"ZURlY29kZT4+CnN0cmVhbQp42uMq5HIK4TJUMABCQwVzIwVzEyOFkFwu/YzUnDIFQ0OFkDSFaBtTEzMLM0tzYyMD"
+    b"CGkO4psCeWZAvpG5MVCTgbmBmaGZOVg0zcwMoQYkDsSm5kZGqXaxIV5criFcgVwADj8Z0QplbmRzdHJlYW0KZW5k"
+    b"b2JqCgo3IDAgb2JqCjw8L0xlbmd0aCA4OC9GaWx0ZXIvRmxhdGVEZWNvZGU+PgpzdHJlYW0KeJzjKuRyCuEyVDAA"
+    b"QkMFcyMgMlIIyeXSz0jNKVMwNFQISVOItjGxNDcxMjAzMbM0NzYzNjc1NwbSQBIoZmaWZm5qlgqUMzRKsYsN8eJy"
+    b"DeEK5AIAS+ITfAplbmRzdHJlYW0KZW5kb2JqCgo4IDAgb2JqCjw8L1R5cGUvUGFnZS9NZWRpYUJveFswIDAgNTk1"
+    b"IDg0Ml0vUm90YXRlIDAvUmVzb3VyY2VzIDMgMCBSL1BhcmVudCAyIDAgUi9Db250ZW50c1s5IDAgUiAxMCAwIFIg"
+    b"MTEgMCBSXT4+CmVuZG9iagoKOSAwIG9iago8PC9MZW5ndGggMTEwL0ZpbHRlci9GbGF0ZURlY29kZT4+CnN0cmVh"
+    b"bQp42hWLsQrDMAxEd32F/iCWbJ8IhA6BLNkC2konx6ZDM3Tp91fhhuPu3dGXVifhFBI2ZSvKftH07p8fi7APfi5W"
+    b"MGOga8IZXlDRLEcChqkmy8E7DA1VT+SbowWXaCW2872IR3+8fKfN6aA/uOkckAplbmRzdHJlYW0KZW5kb2JqCgox"
+    b"MCAwIG9iago8PC9MZW5ndGggMTAxL0ZpbHRlci9GbGF0ZURlY29kZT4+CnN0cmVhbQp42hWJsQ4CMQxD93xF/oA2"
+    b"bWyQEMNJLGxI2U43ca0YYGDh+wmy3+Bn+cgSUrVkqtKypvGWw3O8vlqrxtT17B1HuBUanI2OBztb7pZ+klZwws7/"
+    b"Pwk49mSw27hscZNryF1+2xwX+gplbmRzdHJlYW0KZW5kb2JqCgoxMSAwIG9iago8PC9MZW5ndGggNTYvRmlsdGVy"
+    b"L0ZsYXRlRGVjb2RlPj4Kc3RyZWFtCnic4yrkcgrhMlQwAEJDBWMDAwVLI4WQXC79jNScMgVDQ4WQNIVoG2Mju9gQ"
+    b"Ly7XEK5ALgAKZwsICmVuZHN0cmVhbQplbmRvYmoKCnhyZWYKMCAxMgowMDAwMDAwMDAwIDY1NTM1IGYgCjAwMDAw"
+    b"MDAwMTYgMDAwMDAgbiAKMDAwMDAwMDA2MiAwMDAwMCBuIAowMDAwMDAwMTIwIDAwMDAwIG4gCjAwMDAwMDAxNjEg"
+    b"MDAwMDAgbiAKMDAwMDAwMDI3NCAwMDAwMCBuIAowMDAwMDAwMzYzIDAwMDAwIG4gCjAwMDAwMDA1MzMgMDAwMDAg"
+    b"biAKMDAwMDAwMDY4OSAwMDAwMCBuIAowMDAwMDAwODEwIDAwMDAwIG4gCjAwMDAwMDA5ODkgMDAwMDAgbiAKMDAw"
+    b"MDAwMTE2MCAwMDAwMCBuIAoKdHJhaWxlcgo8PC9TaXplIDEyL1Jvb3QgMSAwIFI+PgpzdGFydHhyZWYKMTI4NQol"
+    b"JUVPRgo="
+)
+
+
+# Test schema matching config/schema.yaml structure; the schema helpers only read it
+_SAMPLE_SCHEMA = {
+    "node_types": {
+        "Paper": {"required": ["title", "year", "source"], "optional": ["doi", "arxiv_id"]},
+        "Concept": {"required": ["name"], "optional": ["aliases"]},
+        "Method": {"required": ["name"], "optional": ["category"]},
+        "Dataset": {"required": ["name"]},
+        "Finding": {"required": ["description", "paper_id"]},
+        "Task": {"required": ["name"]},
+    },
+    "relation_types": {
+        "uses_method": {"from": "Paper", "to": "Method"},
+        "studies_topic": {"from": "Paper", "to": "Concept"},
+        "proposes": {"from": "Paper", "to": "Method"},
+        "extends": {"from": "Paper", "to": "Paper"},
+        "contradicts": {"from": "Finding", "to": "Finding"},
+        "evaluated_on": {"from": "Method", "to": "Dataset"},
+        "part_of": {"from": "Concept", "to": "Concept"},
+    },
+    "aliases": {
+        "scRNA-seq": "single-cell RNA sequencing",
+        "scRNAseq": "single-cell RNA sequencing",
+        "sc-RNA-seq": "single-cell RNA sequencing",
+        "VAE": "variational autoencoder",
+        "GAN": "generative adversarial network",
+    },
+}
+
 
 @pytest.fixture
 def fixture_pdf(tmp_path):
-    """Create a small test PDF with pymupdf programmatically."""
-    import pymupdf
-
+    """Per-test copy of the two-page test PDF."""
     pdf_path = tmp_path / "test.pdf"
-    doc = pymupdf.open()
-
-    # Page 1
-    page = doc.new_page()
-    text_point = pymupdf.Point(72, 100)
-    page.insert_text(text_point, "This is the first page of the paper.")
-    text_point2 = pymupdf.Point(72, 120)
-    page.insert_text(text_point2, "It discusses founda-")
-
-    # Page 2
-    page2 = doc.new_page()
-    text_point3 = pymupdf.Point(72, 100)
-    page2.insert_text(text_point3, "tion models for single-cell analysis.")
-    text_point4 = pymupdf.Point(72, 120)
-    page2.insert_text(text_point4, "The results show improvement.")
-    # Page number
-    text_point5 = pymupdf.Point(300, 750)
-    page2.insert_text(text_point5, "2")
-
-    doc.save(str(pdf_path))
-    doc.close()
+    pdf_path.write_bytes(_PDF_BLOB)
     return pdf_path
 
 
@@ -82,11 +122,13 @@ def fixture_papers():
     ]
 
 
+_DATA_DIRS = ("papers", "analysis", "reports", "runs", "kg_store")
+
+
 @pytest.fixture
 def data_dir(tmp_path):
     """Temporary DATA directory structure."""
-    dirs = ["papers", "analysis", "reports", "runs", "kg_store"]
-    for d in dirs:
+    for d in _DATA_DIRS:
         (tmp_path / d).mkdir()
     return tmp_path
 
@@ -104,9 +146,12 @@ def mock_llm():
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def small_graph():
-    """5-node, 8-edge NetworkX graph for testing."""
+    """5-node, 8-edge NetworkX graph for testing.
+
+    Built once and frozen: tests that modify the graph use mutable_small_graph.
+    """
     G = nx.Graph()
     G.add_node("single-cell RNA sequencing", entity_type="Concept", name="single-cell RNA sequencing")
     G.add_node("foundation model", entity_type="Concept", name="foundation model")
@@ -122,35 +167,16 @@ def small_graph():
     G.add_edge("foundation model", "cell type annotation", relation_type="related_to")
     G.add_edge("single-cell RNA sequencing", "cell type annotation", relation_type="related_to")
     G.add_edge("cell type annotation", "PBMC dataset", relation_type="related_to")
-    return G
+    return nx.freeze(G)
 
 
 @pytest.fixture
+def mutable_small_graph(small_graph):
+    """Private, modifiable copy of small_graph (node/edge data dicts are copied too)."""
+    return small_graph.copy()
+
+
+@pytest.fixture(scope="session")
 def sample_schema():
-    """Test schema dict matching config/schema.yaml structure."""
-    return {
-        "node_types": {
-            "Paper": {"required": ["title", "year", "source"], "optional": ["doi", "arxiv_id"]},
-            "Concept": {"required": ["name"], "optional": ["aliases"]},
-            "Method": {"required": ["name"], "optional": ["category"]},
-            "Dataset": {"required": ["name"]},
-            "Finding": {"required": ["description", "paper_id"]},
-            "Task": {"required": ["name"]},
-        },
-        "relation_types": {
-            "uses_method": {"from": "Paper", "to": "Method"},
-            "studies_topic": {"from": "Paper", "to": "Concept"},
-            "proposes": {"from": "Paper", "to": "Method"},
-            "extends": {"from": "Paper", "to": "Paper"},
-            "contradicts": {"from": "Finding", "to": "Finding"},
-            "evaluated_on": {"from": "Method", "to": "Dataset"},
-            "part_of": {"from": "Concept", "to": "Concept"},
-        },
-        "aliases": {
-            "scRNA-seq": "single-cell RNA sequencing",
-            "scRNAseq": "single-cell RNA sequencing",
-            "sc-RNA-seq": "single-cell RNA sequencing",
-            "VAE": "variational autoencoder",
-            "GAN": "generative adversarial network",
-        },
-    }
+    """Test schema dict matching config/schema.yaml structure (shared, do not modify)."""
+    return _SAMPLE_SCHEMA
@@ -0,0 +1,18 @@
+"""Fixtures shared by the offline test modules."""
+
+from __future__ import annotations
+
+import pytest
+
+from litgraph.llm.prompts import reset_prompt_cache
+from litgraph.settings import reset_settings
+
+
+@pytest.fixture(autouse=True)
+def _reset_settings():
+    """Drop the Settings singleton and prompt caches before and after each test."""
+    reset_settings()
+    reset_prompt_cache()
+    yield
+    reset_settings()
+    reset_prompt_cache()
@@ -0,0 +1,88 @@
+"""Tests for concurrent batch analysis and stats aggregation."""
+
+from __future__ import annotations
+
+import json
+from contextlib import nullcontext
+from unittest.mock import patch
+
+import pytest
+
+from litgraph.analysis.batch import _pdf_pool, analyze_batch
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch):
+    monkeypatch.setenv("LITGRAPH_MODE", "pro")
+
+
+@pytest.fixture
+def index(data_dir):
+    papers = [
+        {"paper_id": f"arxiv:test{i}", "title": f"Test {i}", "dedup_key": f"arxiv:test{i}"}
+        for i in range(6)
+    ]
+    (data_dir / "papers" / "index.json").write_text(json.dumps(papers))
+    return papers
+
+
+class TestAnalyzeBatch:
+    @patch("litgraph.analysis.batch.analyze_paper")
+    def test_all_papers_dispatched(self, mock_analyze, data_dir, index):
+        mock_analyze.side_effect = lambda paper, _dir, **_kw: data_dir / "analysis" / "x.md"
+
+        stats = analyze_batch(all_pending=True, data_dir=data_dir, max_workers=4)
+        assert stats["analyzed"] == len(index)
+        assert stats["failed"] == 0
+        assert mock_analyze.call_count == len(index)
+
+    @patch("litgraph.analysis.batch.analyze_paper")
+    def test_failures_aggregated(self, mock_analyze, data_dir, index):
+        def fake(paper, _dir, **_kw):
+            if paper["paper_id"] == "arxiv:test0":
+                raise RuntimeError("boom")
+            if paper["paper_id"] == "arxiv:test1":
+                return None
+            return data_dir / "analysis" / "x.md"
+
+        mock_analyze.side_effect = fake
+
+        stats = analyze_batch(all_pending=True, data_dir=data_dir, max_workers=4)
+        assert stats["analyzed"] == len(index) - 2
+        assert stats["failed"] == 2
+        assert stats["errors"] == [{"paper_id": "arxiv:test0", "error": "boom"}]
+
+    @patch("litgraph.analysis.batch.analyze_paper")
+    def test_pdf_pool_shared_across_papers(self, mock_analyze, data_dir, index):
+        executors = []
+
+        def fake(paper, _dir, pdf_executor=None):
+            executors.append(pdf_executor)
+            return data_dir / "analysis" / "x.md"
+
+        mock_analyze.side_effect = fake
+        with patch("litgraph.analysis.batch._pdf_pool") as mock_pool:
+            mock_pool.return_value.__enter__.return_value = sentinel = object()
+            analyze_batch(all_pending=True, data_dir=data_dir, max_workers=4)
+        assert executors == [sentinel] * len(index)
+
+    def test_pdf_pool_skipped_without_pdfs(self, index):
+        assert isinstance(_pdf_pool(index, 4), nullcontext)
+        with_pdf = [{**p, "pdf_url": "http://x/p.pdf"} for p in index]
+        assert isinstance(_pdf_pool(with_pdf, 1), nullcontext)
+
+    @patch("litgraph.analysis.batch.analyze_paper")
+    def test_all_pending_skips_analyzed(self, mock_analyze, data_dir, index):
+        mock_analyze.side_effect = lambda paper, _dir, **_kw: data_dir / "analysis" / "x.md"
+        (data_dir / "analysis" / "arxiv_test0.md").write_text("done")
+        (data_dir / "analysis" / "arxiv_test1.v1.md").write_text("old")
+
+        stats = analyze_batch(all_pending=True, data_dir=data_dir, max_workers=2)
+        dispatched = {c.args[0]["paper_id"] for c in mock_analyze.call_args_list}
+        assert stats["analyzed"] == len(index) - 1
+        assert "arxiv:test0" not in dispatched
+        assert "arxiv:test1" in dispatched
+
+    def test_no_papers(self, data_dir):
+        stats = analyze_batch(all_pending=True, data_dir=data_dir)
+        assert stats == {"analyzed": 0, "skipped": 0, "failed": 0, "errors": []}
@@ -2,23 +2,27 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 import yaml
 
-from litgraph.analysis.paper import _extract_questions_version, analyze_paper
-from litgraph.settings import reset_settings
+from litgraph.analysis.paper import (
+    _extract_questions_version,
+    analyze_paper,
+    list_analysis_files,
+    list_recent_analysis_files,
+    read_analysis_texts,
+    safe_paper_id,
+)
 
 
 @pytest.fixture(autouse=True)
-def _clean_settings(monkeypatch):
-    reset_settings()
+def _env(monkeypatch):
     # Ensure settings can load without real .env
     monkeypatch.setenv("LITGRAPH_MODE", "pro")
-    yield
-    reset_settings()
 
 
 @pytest.fixture
@@ -61,26 +65,29 @@ def project_root(tmp_path):
     return tmp_path
 
 
+@pytest.fixture
+def _settings(project_root):
+    """Load settings from the test project_root."""
+    from litgraph.settings import get_settings
+
+    return get_settings(project_root=project_root, force_reload=True)
+
+
+@pytest.mark.usefixtures("_settings")
 class TestAnalyzePaper:
     @patch("litgraph.analysis.paper.complete")
-    def test_creates_markdown(self, mock_complete, paper, data_dir, project_root, monkeypatch):
+    def test_creates_markdown(self, mock_complete, paper, data_dir, monkeypatch):
         mock_complete.return_value = "## What problem?\n\nThe problem is X.\n"
 
-        from litgraph.settings import get_settings
-        get_settings(project_root=project_root, force_reload=True)
-
         result = analyze_paper(paper, data_dir)
         assert result is not None
         assert result.exists()
         assert result.suffix == ".md"
 
     @patch("litgraph.analysis.paper.complete")
-    def test_front_matter_fields(self, mock_complete, paper, data_dir, project_root):
+    def test_front_matter_fields(self, mock_complete, paper, data_dir):
         mock_complete.return_value = "## Answer\n\nSome answer.\n"
 
-        from litgraph.settings import get_settings
-        get_settings(project_root=project_root, force_reload=True)
-
         result = analyze_paper(paper, data_dir)
         content = result.read_text()
 
@@ -97,13 +104,10 @@ class TestAnalyzePaper:
         assert "mode" in front_matter
 
     @patch("litgraph.analysis.paper.complete")
-    def test_skip_existing(self, mock_complete, paper, data_dir, project_root):
+    def test_skip_existing(self, mock_complete, paper, data_dir):
         """Already analyzed paper with matching version should be skipped."""
         mock_complete.return_value = "## Answer\nSome answer.\n"
 
-        from litgraph.settings import get_settings
-        get_settings(project_root=project_root, force_reload=True)
-
         # Analyze once
         result1 = analyze_paper(paper, data_dir)
         # Analyze again — should skip
@@ -117,9 +121,6 @@ class TestAnalyzePaper:
         """Version mismatch should rename old file and re-analyze."""
         mock_complete.return_value = "## Answer\nSome answer.\n"
 
-        from litgraph.settings import get_settings
-        get_settings(project_root=project_root, force_reload=True)
-
         # Create analysis with version 1
         result = analyze_paper(paper, data_dir)
         assert result.exists()
@@ -142,14 +143,65 @@ class TestAnalyzePaper:
         assert len(old_files) == 1
 
     @patch("litgraph.analysis.paper.complete")
-    def test_source_type_abstract_only(self, mock_complete, paper, data_dir, project_root):
+    def test_skip_check_uses_version_sidecar(self, mock_complete, paper, data_dir):
+        """An up-to-date analysis is skipped without re-parsing its front matter."""
+        mock_complete.return_value = "## Answer\nSome answer.\n"
+
+        analyze_paper(paper, data_dir)
+        md_path = data_dir / "analysis" / "arxiv_2401.12345.md"
+        sidecar = json.loads((data_dir / "analysis" / "_versions.json").read_text())
+        st = md_path.stat()
+        assert sidecar == {"arxiv_2401.12345": [1, st.st_mtime_ns, st.st_size]}
+
+        with patch("litgraph.analysis.paper._extract_questions_version") as mock_extract:
+            analyze_paper(paper, data_dir)
+        mock_extract.assert_not_called()
+        assert mock_complete.call_count == 1
+
+    @patch("litgraph.analysis.paper.complete")
+    def test_replaced_file_rechecked(self, mock_complete, paper, data_dir):
+        """A file replaced behind the sidecar's back is judged by its front matter."""
+        mock_complete.return_value = "## Answer\nSome answer.\n"
+
+        md_path = analyze_paper(paper, data_dir)
+        md_path.write_text("---\nquestions_version: 0\n---\n\nRestored old analysis.\n")
+        analyze_paper(paper, data_dir)
+        assert (data_dir / "analysis" / "arxiv_2401.12345.v0.md").exists()
+        assert mock_complete.call_count == 1  # response cache serves the re-analysis
+
+    @patch("litgraph.analysis.paper.complete")
+    def test_unrecorded_fresh_analysis_kept(self, mock_complete, paper, data_dir):
+        """A crash after writing but before recording must not rename the fresh file."""
+        import litgraph.analysis.paper as paper_mod
+
+        mock_complete.return_value = "## Answer\nSome answer.\n"
+
+        with patch("litgraph.analysis.paper._record_version"):
+            analyze_paper(paper, data_dir)
+        # Sidecar still describes the previous (v0) analysis
+        (data_dir / "analysis" / "_versions.json").write_text('{"arxiv_2401.12345": [0, 1, 1]}')
+        paper_mod._version_indexes.clear()
+        analyze_paper(paper, data_dir)
+        assert list((data_dir / "analysis").glob("*.v*.md")) == []
+
+    @patch("litgraph.analysis.paper.complete")
+    def test_reanalysis_uses_response_cache(self, mock_complete, paper, data_dir):
+        """Re-analyzing with identical prompts should not call the LLM again."""
+        mock_complete.return_value = "## Answer\nCached answer.\n"
+
+        result = analyze_paper(paper, data_dir)
+        result.unlink()
+
+        result2 = analyze_paper(paper, data_dir)
+        assert "Cached answer." in result2.read_text()
+        assert mock_complete.call_count == 1
+
+    @patch("litgraph.analysis.paper.complete")
+    def test_source_type_abstract_only(self, mock_complete, paper, data_dir):
         """Paper without pdf_url should be abstract_only."""
         mock_complete.return_value = "## Answer\nAbstract analysis.\n"
         paper["pdf_url"] = None
 
-        from litgraph.settings import get_settings
-        get_settings(project_root=project_root, force_reload=True)
-
         result = analyze_paper(paper, data_dir)
         content = result.read_text()
         end = content.index("---", 3)
@@ -172,3 +224,51 @@ class TestExtractQuestionsVersion:
         md = tmp_path / "test.md"
         md.write_text("# Just content\nNo front matter.\n")
         assert _extract_questions_version(md) is None
+
+    def test_unterminated_front_matter(self, tmp_path):
+        md = tmp_path / "test.md"
+        md.write_text("---\nquestions_version: 2\ntitle: Test\n")
+        assert _extract_questions_version(md) is None
+
+    def test_body_not_parsed(self, tmp_path):
+        md = tmp_path / "test.md"
+        md.write_text("---\nquestions_version: 3\n---\n\n: not: valid: yaml: [\n")
+        assert _extract_questions_version(md) == 3
+
+    def test_nested_key_ignored(self, tmp_path):
+        md = tmp_path / "test.md"
+        md.write_text("---\nmeta:\n  questions_version: 9\nquestions_version: 4\n---\n")
+        assert _extract_questions_version(md) == 4
+
+
+class TestSafePaperId:
+    def test_replaces_separators(self):
+        assert safe_paper_id("arxiv:2401.12345") == "arxiv_2401.12345"
+        assert safe_paper_id("doi:10.1234/abc/def") == "doi_10.1234_abc_def"
+
+
+class TestListAnalysisFiles:
+    def test_excludes_versioned_backups(self, tmp_path):
+        for name in ["b.md", "a.md", "a.v1.md", "a.v123.md", "vendor.md", "notes.txt"]:
+            (tmp_path / name).write_text("x")
+        assert [f.name for f in list_analysis_files(tmp_path)] == ["a.md", "b.md", "vendor.md"]
+
+    def test_recent_newest_first(self, tmp_path):
+        import os
+
+        for i, name in enumerate(["a.md", "b.md", "c.md", "c.v1.md", "d.md"]):
+            (tmp_path / name).write_text("x")
+            os.utime(tmp_path / name, (1000 + i, 1000 + i))
+        os.utime(tmp_path / "a.md", (1002, 1002))  # same mtime as c.md → name order
+        names = [f.name for f in list_recent_analysis_files(tmp_path, 3)]
+        assert names == ["d.md", "a.md", "c.md"]
+
+
+class TestReadAnalysisTexts:
+    def test_order_preserved(self, tmp_path):
+        files = []
+        for i in range(40):
+            f = tmp_path / f"{i:02d}.md"
+            f.write_text(f"analysis {i} — ü", encoding="utf-8")
+            files.append(f)
+        assert read_analysis_texts(files) == [f"analysis {i} — ü" for i in range(40)]
@@ -3,31 +3,26 @@
 from __future__ import annotations
 
 import json
+import os
 from unittest.mock import MagicMock, patch
 
+import click
 import pytest
 from click.testing import CliRunner
 
 from litgraph.cli import main
-from litgraph.settings import reset_settings
 
 
-@pytest.fixture(autouse=True)
-def _clean(monkeypatch):
-    reset_settings()
-    yield
-    reset_settings()
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runner():
     return CliRunner()
 
 
-@pytest.fixture
-def project_root(tmp_path):
-    """Minimal config for settings."""
-    config_dir = tmp_path / "config"
+@pytest.fixture(scope="session")
+def project_root(tmp_path_factory):
+    """Minimal config for settings (read-only; shared by the session)."""
+    root = tmp_path_factory.mktemp("cfg")
+    config_dir = root / "config"
     config_dir.mkdir()
     prompts_dir = config_dir / "prompts"
     prompts_dir.mkdir()
@@ -36,11 +31,11 @@ def project_root(tmp_path):
     )
     (config_dir / "schema.yaml").write_text("node_types: {}\n")
     (config_dir / "config.default.yaml").write_text("{}\n")
-    for name in ["paper_analysis", "relevance_filter", "entity_extraction", "innovation", "keyword_expansion"]:
+    for name in ["paper_analysis", "relevance_filter", "relevance_filter_batch", "entity_extraction", "innovation", "keyword_expansion"]:
         (prompts_dir / f"{name}.yaml").write_text(
             f"version: 1\nsystem: Test.\ntemplate: |\n  test\n"
         )
-    return tmp_path
+    return root
 
 
 class TestModeRouting:
@@ -62,54 +57,36 @@ class TestModeRouting:
         assert settings.llm.best_model != settings.llm.cheap_model
 
 
-class TestCLISubcommands:
-    def test_main_help(self, runner):
-        result = runner.invoke(main, ["--help"])
-        assert result.exit_code == 0
-        assert "LitGraph" in result.output
-
-    def test_search_help(self, runner):
-        result = runner.invoke(main, ["search", "--help"])
-        assert result.exit_code == 0
-        assert "--keywords" in result.output
-
-    def test_filter_help(self, runner):
-        result = runner.invoke(main, ["filter", "--help"])
-        assert result.exit_code == 0
-        assert "--min-citations" in result.output
-
-    def test_analyze_help(self, runner):
-        result = runner.invoke(main, ["analyze", "--help"])
-        assert result.exit_code == 0
-        assert "--paper-ids" in result.output
-        assert "--all-pending" in result.output
+def _help_text(*names: str) -> str:
+    """Render --help for a (sub)command without running the CLI."""
+    cmd = main
+    ctx = click.Context(main, info_name="litgraph")
+    for name in names:
+        cmd = cmd.get_command(ctx, name)
+        assert cmd is not None, name
+        ctx = click.Context(cmd, info_name=name, parent=ctx)
+    return cmd.get_help(ctx)
 
-    def test_kg_help(self, runner):
-        result = runner.invoke(main, ["kg", "--help"])
-        assert result.exit_code == 0
-        assert "update" in result.output
-        assert "query" in result.output
-        assert "expand" in result.output
-        assert "stats" in result.output
 
-    def test_innovate_help(self, runner):
-        result = runner.invoke(main, ["innovate", "--help"])
-        assert result.exit_code == 0
-        assert "--scope" in result.output
-
-    def test_run_help(self, runner):
-        result = runner.invoke(main, ["run", "--help"])
-        assert result.exit_code == 0
-        assert "--keywords" in result.output
-        assert "--resume" in result.output
-
-    def test_config_show_help(self, runner):
-        result = runner.invoke(main, ["config", "show", "--help"])
-        assert result.exit_code == 0
-
-    def test_config_validate_help(self, runner):
-        result = runner.invoke(main, ["config", "validate", "--help"])
-        assert result.exit_code == 0
+class TestCLISubcommands:
+    @pytest.mark.parametrize(
+        "command,needles",
+        [
+            ("", ["LitGraph"]),
+            ("search", ["--keywords"]),
+            ("filter", ["--min-citations"]),
+            ("analyze", ["--paper-ids", "--all-pending"]),
+            ("kg", ["update", "query", "expand", "stats"]),
+            ("innovate", ["--scope"]),
+            ("run", ["--keywords", "--resume"]),
+            ("config show", ["Usage: litgraph config show"]),
+            ("config validate", ["Usage: litgraph config validate"]),
+        ],
+    )
+    def test_help(self, command, needles):
+        help_text = _help_text(*command.split())
+        for needle in needles:
+            assert needle in help_text
 
 
 class TestCLIConfigShow:
@@ -136,3 +113,36 @@ class TestCLILiteWarning:
         result = runner.invoke(main, ["--mode", "lite", "config", "show"])
         assert result.exit_code == 0
         assert "Mode: lite" in result.output
+
+    def test_mode_flag_leaves_environment_untouched(self, runner, monkeypatch):
+        monkeypatch.setenv("LITGRAPH_MODE", "pro")
+        runner.invoke(main, ["--mode", "lite", "config", "show"])
+        assert os.environ["LITGRAPH_MODE"] == "pro"
+
+
+class TestCLIFilter:
+    @pytest.fixture
+    def index_path(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("LITGRAPH_MODE", "pro")
+        monkeypatch.setenv("LITGRAPH_DATA_DIR", str(tmp_path))
+        path = tmp_path / "papers" / "index.json"
+        path.parent.mkdir()
+        path.write_text(json.dumps([
+            {"paper_id": "a", "title": "A", "citations": 10},
+            {"paper_id": "b", "title": "B", "citations": 1},
+        ]))
+        return path
+
+    def test_marks_relevant_papers(self, runner, index_path):
+        result = runner.invoke(main, ["filter", "--min-citations", "5"])
+        assert result.exit_code == 0
+        assert "1/2" in result.output
+        papers = json.loads(index_path.read_text())
+        assert [p.get("relevant") for p in papers] == [True, None]
+
+    def test_index_not_rewritten_when_unchanged(self, runner, index_path):
+        runner.invoke(main, ["filter", "--min-citations", "5"])
+        with patch("litgraph.search.dedup.atomic_write_bytes") as mock_write:
+            result = runner.invoke(main, ["filter", "--min-citations", "5"])
+        assert result.exit_code == 0
+        mock_write.assert_not_called()
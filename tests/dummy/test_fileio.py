@@ -0,0 +1,28 @@
+"""Tests for atomic file writes."""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from litgraph.fileio import atomic_write_text
+
+
+class TestAtomicWrite:
+    def test_replaces_existing_file(self, tmp_path):
+        path = tmp_path / "a.md"
+        path.write_text("old")
+        atomic_write_text(path, "new — ü")
+        assert path.read_text(encoding="utf-8") == "new — ü"
+        assert os.listdir(tmp_path) == ["a.md"]
+
+    def test_failed_replace_keeps_original(self, tmp_path):
+        path = tmp_path / "a.md"
+        path.write_text("old")
+        with patch("litgraph.fileio.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                atomic_write_text(path, "new")
+        assert path.read_text() == "old"
+        assert os.listdir(tmp_path) == ["a.md"]
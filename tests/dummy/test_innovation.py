@@ -8,15 +8,10 @@ from unittest.mock import patch
 
 import pytest
 
-from litgraph.settings import reset_settings
-
 
 @pytest.fixture(autouse=True)
-def _clean(monkeypatch):
-    reset_settings()
+def _env(monkeypatch):
     monkeypatch.setenv("LITGRAPH_MODE", "pro")
-    yield
-    reset_settings()
 
 
 @pytest.fixture
@@ -104,6 +99,17 @@ class TestIdentifyInnovations:
         assert len(result) > 0
 
 
+class TestGatherAnalyses:
+    def test_summary_truncated_to_500_chars(self, data_dir):
+        from litgraph.analysis.innovation import _gather_analyses
+
+        (data_dir / "analysis" / "exact.md").write_text("a" * 500)
+        (data_dir / "analysis" / "long.md").write_text("b" * 5000)
+        block = _gather_analyses("all", data_dir)
+        assert "### exact\n" + "a" * 500 + "\n" in block
+        assert block.endswith("### long\n" + "b" * 500 + "...")
+
+
 class TestSaveReport:
     def test_creates_report_file(self, data_dir, project_root, monkeypatch):
         from litgraph.settings import get_settings
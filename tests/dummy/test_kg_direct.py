@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import networkx as nx
 import pytest
 
-from litgraph.kg.direct import expand_keywords, get_stats, get_subgraph, load_graph
+from litgraph.kg.direct import (
+    expand_keywords,
+    get_stats,
+    get_subgraph,
+    load_graph,
+)
 
 
 class TestExpandKeywords:
@@ -32,6 +39,10 @@ class TestExpandKeywords:
         results = expand_keywords(small_graph, ["ProtoCORAL"], max_hops=3, max_results=2)
         assert len(results) <= 2
 
+    def test_many_seeds_respect_cap(self, small_graph):
+        seeds = ["ProtoCORAL", "foundation model", "cell type annotation"]
+        assert expand_keywords(small_graph, seeds, max_hops=0, max_results=2) == seeds[:2]
+
     def test_nonexistent_seed(self, small_graph):
         """Non-existent seed should return empty."""
         results = expand_keywords(small_graph, ["nonexistent_node"])
@@ -48,10 +59,75 @@ class TestExpandKeywords:
         results = expand_keywords(small_graph, ["protocoral"])
         assert len(results) > 0
 
+    def test_seed_index_sees_new_nodes(self, mutable_small_graph):
+        """Nodes added after a first call must still be found as seeds."""
+        expand_keywords(mutable_small_graph, ["ProtoCORAL"])
+        mutable_small_graph.add_node("scGPT", entity_type="Method", name="scGPT")
+        assert expand_keywords(mutable_small_graph, ["SCGPT"], max_hops=0) == ["scGPT"]
+
+    def test_seed_index_sees_replaced_nodes(self):
+        """A remove+add that keeps the node count must not leave a stale index."""
+        G = nx.Graph()
+        G.add_node("A", entity_type="Concept", name="A")
+        G.add_node("C", entity_type="Concept", name="C")
+        expand_keywords(G, ["A"])
+        G.remove_node("A")
+        G.add_node("B", entity_type="Concept", name="B")
+        assert expand_keywords(G, ["B"], max_hops=0) == ["B"]
+        assert expand_keywords(G, ["A"], max_hops=0) == []
+
+    def test_traverses_non_expandable_nodes(self):
+        """Concepts behind a Paper hub are still reached within max_hops."""
+        G = nx.Graph()
+        G.add_node("m", entity_type="Method", name="m")
+        G.add_node("p", entity_type="Paper", name="p")
+        G.add_node("c", entity_type="Concept", name="c")
+        G.add_node("far", entity_type="Concept", name="far")
+        G.add_edges_from([("m", "p"), ("p", "c"), ("c", "far")])
+        assert sorted(expand_keywords(G, ["m"], max_hops=2)) == ["c", "m"]
+
+    def test_cap_keeps_nearest_nodes(self):
+        """With a cap, results are the first expandable nodes in BFS order."""
+        G = nx.relabel_nodes(nx.path_graph(10), str)
+        nx.set_node_attributes(G, "Concept", "entity_type")
+        assert expand_keywords(G, ["0"], max_hops=9, max_results=3) == ["0", "1", "2"]
+
+    def test_cap_prefers_high_degree_neighbors(self):
+        G = nx.Graph()
+        for n in ["seed", "leaf", "hub", "a", "b", "c"]:
+            G.add_node(n, entity_type="Concept", name=n)
+        G.add_edges_from([("seed", "leaf"), ("seed", "hub"), ("hub", "a"), ("hub", "b"), ("hub", "c")])
+        assert sorted(expand_keywords(G, ["seed"], max_hops=1, max_results=2)) == ["hub", "seed"]
+
+    def test_storage_upsert_drops_seed_index(self, mutable_small_graph):
+        import litgraph.kg.direct as direct_mod
+        from litgraph.kg.graph import SchemaAwareStorage
+
+        class FakeStorage:
+            _graph = mutable_small_graph
+
+            async def upsert_node(self, node_id, node_data=None):
+                self._graph.nodes[node_id].update(node_data or {})
+
+            async def upsert_edge(self, src_id, tgt_id, edge_data=None):
+                pass
+
+        storage = SchemaAwareStorage.patch_storage(FakeStorage())
+        expand_keywords(mutable_small_graph, ["ProtoCORAL"])
+        assert mutable_small_graph in direct_mod._graph_caches
+        asyncio.run(storage.upsert_node("PBMC dataset", {"entity_type": "Concept"}))
+        assert mutable_small_graph not in direct_mod._graph_caches
+
+
+@pytest.fixture(scope="module")
+def proto_subgraph_h1(small_graph):
+    """1-hop subgraph around ProtoCORAL, built once for the read-only tests."""
+    return get_subgraph(small_graph, "ProtoCORAL", max_hops=1)
+
 
 class TestGetSubgraph:
-    def test_basic_subgraph(self, small_graph):
-        sub = get_subgraph(small_graph, "ProtoCORAL", max_hops=1)
+    def test_basic_subgraph(self, proto_subgraph_h1):
+        sub = proto_subgraph_h1
         assert "ProtoCORAL" in sub.nodes
         assert sub.number_of_nodes() > 1
 
@@ -64,9 +140,16 @@ class TestGetSubgraph:
         sub = get_subgraph(small_graph, "nonexistent")
         assert sub.number_of_nodes() == 0
 
-    def test_preserves_edges(self, small_graph):
-        sub = get_subgraph(small_graph, "ProtoCORAL", max_hops=1)
-        assert sub.number_of_edges() > 0
+    def test_preserves_edges(self, proto_subgraph_h1):
+        assert proto_subgraph_h1.number_of_edges() > 0
+
+    @pytest.mark.parametrize("max_hops", [0, 1, 2, 3])
+    def test_matches_shortest_path_cutoff(self, max_hops):
+        G = nx.relabel_nodes(nx.balanced_tree(2, 4), str)
+        expected = nx.single_source_shortest_path_length(G, "1", cutoff=max_hops)
+        sub = get_subgraph(G, "1", max_hops=max_hops)
+        assert set(sub.nodes) == set(expected)
+        assert nx.utils.edges_equal(sub.edges, G.subgraph(expected).edges)
 
 
 class TestGetStats:
@@ -92,6 +175,13 @@ class TestGetStats:
         assert stats["node_types"] == {}
         assert stats["relation_types"] == {}
 
+    def test_reflects_in_place_edits(self, mutable_small_graph):
+        assert get_stats(mutable_small_graph)["node_types"]["Task"] == 1
+        mutable_small_graph.add_node("gene regulatory network inference", entity_type="Task")
+        assert get_stats(mutable_small_graph)["node_types"]["Task"] == 2
+        mutable_small_graph.nodes["PBMC dataset"]["entity_type"] = "Concept"
+        assert get_stats(mutable_small_graph)["node_types"]["Concept"] == 3
+
 
 class TestLoadGraph:
     def test_load_nonexistent(self, tmp_path):
@@ -45,6 +45,24 @@ class TestNormalizeEntity:
     def test_empty_string(self, sample_schema):
         assert normalize_entity("", sample_schema) == ""
 
+    def test_default_schema_index_rebuilt_after_reset(self, sample_schema, monkeypatch):
+        import litgraph.kg.schema as schema_mod
+
+        monkeypatch.setattr(schema_mod, "_schema_cache", sample_schema)
+        assert normalize_entity("vae") == "variational autoencoder"
+
+        reset_schema_cache()
+        monkeypatch.setattr(schema_mod, "_schema_cache", {"aliases": {"VAE": "VAE model"}})
+        assert normalize_entity("vae") == "VAE model"
+
+    def test_explicit_schema_edits_seen(self):
+        schema = {"aliases": {"GAN": "GAN model"}}
+        assert normalize_entity("gan", schema) == "GAN model"
+        schema["aliases"]["VAE"] = "VAE model"
+        schema["aliases"]["GAN"] = "generative adversarial network"
+        assert normalize_entity("vae", schema) == "VAE model"
+        assert normalize_entity("gan", schema) == "generative adversarial network"
+
 
 class TestValidateEntity:
     def test_valid_types(self, sample_schema):
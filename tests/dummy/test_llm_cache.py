@@ -0,0 +1,59 @@
+"""Tests for the persistent LLM response cache."""
+
+from __future__ import annotations
+
+import os
+import time
+
+from litgraph.llm.cache import ResponseCache
+
+
+class TestCacheKey:
+    def test_deterministic(self):
+        assert ResponseCache.key("m", "sys", "hi") == ResponseCache.key("m", "sys", "hi")
+
+    def test_model_changes_key(self):
+        assert ResponseCache.key("a", "sys", "hi") != ResponseCache.key("b", "sys", "hi")
+
+    def test_system_prompt_changes_key(self):
+        assert ResponseCache.key("m", None, "hi") != ResponseCache.key("m", "sys", "hi")
+
+    def test_extra_changes_key(self):
+        k1 = ResponseCache.key("m", "sys", "hi", questions_version=1)
+        k2 = ResponseCache.key("m", "sys", "hi", questions_version=2)
+        assert k1 != k2
+
+
+class TestResponseCache:
+    def test_miss(self, tmp_path):
+        cache = ResponseCache(tmp_path / "llm_cache")
+        assert cache.get(ResponseCache.key("m", None, "hi")) is None
+
+    def test_roundtrip(self, tmp_path):
+        cache = ResponseCache(tmp_path / "llm_cache")
+        key = ResponseCache.key("m", None, "hi")
+        cache.set(key, "## Answer\n\nÜnïcode ok.")
+        assert cache.get(key) == "## Answer\n\nÜnïcode ok."
+
+    def test_empty_response_not_cached(self, tmp_path):
+        cache = ResponseCache(tmp_path / "llm_cache")
+        key = ResponseCache.key("m", None, "hi")
+        cache.set(key, "")
+        assert cache.get(key) is None
+
+    def test_expired_entry_is_removed(self, tmp_path):
+        cache = ResponseCache(tmp_path / "llm_cache", max_age=60)
+        key = ResponseCache.key("m", None, "hi")
+        cache.set(key, "old")
+        path = cache._path(key)
+        stale = time.time() - 120
+        os.utime(path, (stale, stale))
+        assert cache.get(key) is None
+        assert not path.exists()
+
+    def test_no_max_age_keeps_entries(self, tmp_path):
+        cache = ResponseCache(tmp_path / "llm_cache", max_age=None)
+        key = ResponseCache.key("m", None, "hi")
+        cache.set(key, "old")
+        os.utime(cache._path(key), (0, 0))
+        assert cache.get(key) == "old"
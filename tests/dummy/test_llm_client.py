@@ -0,0 +1,169 @@
+"""Offline tests for the LLM client's nano-graphrag wrappers (complete() is mocked)."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from litgraph.llm.client import (
+    _kv_cache_key,
+    best_model_complete,
+    cheap_model_complete,
+    complete,
+    reset_client,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean(monkeypatch):
+    reset_client()
+    monkeypatch.setenv("LITGRAPH_MODE", "pro")
+    monkeypatch.delenv("ANTHROPIC_OAUTH_TOKEN", raising=False)
+    monkeypatch.setenv("LITGRAPH_ANTHROPIC_API_KEY", "sk-ant-api-test")
+    monkeypatch.setenv("LITGRAPH_PRO_BEST_MODEL", "best-m")
+    monkeypatch.setenv("LITGRAPH_PRO_CHEAP_MODEL", "cheap-m")
+    yield
+    reset_client()
+
+
+class FakeKV:
+    def __init__(self):
+        self.data = {}
+
+    async def get_by_id(self, key):
+        return self.data.get(key)
+
+    async def upsert(self, items):
+        self.data.update(items)
+
+
+class TestKVCacheKey:
+    def test_fixed_length(self):
+        assert len(_kv_cache_key("m", "x" * 100_000, "sys")) == 32
+
+    def test_fields_do_not_run_together(self):
+        assert _kv_cache_key("m", "b", "a_") != _kv_cache_key("m", "_b", "a")
+
+    def test_none_system_prompt(self):
+        assert _kv_cache_key("m", "p", None) == _kv_cache_key("m", "p", "")
+
+
+class TestModelCompleteWrappers:
+    @patch("litgraph.llm.client.complete", return_value="answer")
+    def test_hashing_kv_hit_skips_llm(self, mock_complete):
+        kv = FakeKV()
+        assert asyncio.run(best_model_complete("p", "s", hashing_kv=kv)) == "answer"
+        assert asyncio.run(best_model_complete("p", "s", hashing_kv=kv)) == "answer"
+        assert mock_complete.call_count == 1
+
+    @patch("litgraph.llm.client.complete", side_effect=["best answer", "cheap answer"])
+    def test_models_cached_separately(self, mock_complete):
+        kv = FakeKV()
+        assert asyncio.run(best_model_complete("p", "s", hashing_kv=kv)) == "best answer"
+        assert asyncio.run(cheap_model_complete("p", "s", hashing_kv=kv)) == "cheap answer"
+        assert len(kv.data) == 2
+
+    @patch("litgraph.llm.client.complete", return_value="answer")
+    def test_without_hashing_kv(self, mock_complete):
+        assert asyncio.run(cheap_model_complete("p")) == "answer"
+        mock_complete.assert_called_once_with("p", None, "cheap")
+
+
+class TestCompleteNotMemoized:
+    @patch("litgraph.llm.client._complete_anthropic_sdk", side_effect=["first", "second"])
+    def test_repeat_prompt_reaches_provider(self, mock_sdk):
+        assert complete("p", "s") == "first"
+        assert complete("p", "s") == "second"
+        assert mock_sdk.call_count == 2
+
+
+class TestModelName:
+    def test_settings_reload_picks_up_new_model(self, monkeypatch):
+        from litgraph.llm.client import _model_name
+        from litgraph.settings import get_settings
+
+        assert _model_name(get_settings().llm, "best") == "best-m"
+        monkeypatch.setenv("LITGRAPH_PRO_BEST_MODEL", "best-m2")
+        assert _model_name(get_settings(force_reload=True).llm, "best") == "best-m2"
+
+
+class TestOAuthAsyncPath:
+    def test_awaits_httpx_without_sync_complete(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_OAUTH_TOKEN", "sk-ant-oat-test")
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"content": [{"type": "text", "text": "oauth answer"}]})
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            with patch("litgraph.llm.client._get_async_httpx_client", return_value=client):
+                return await best_model_complete("p", "s")
+
+        with patch("litgraph.llm.client.complete") as mock_complete:
+            assert asyncio.run(run()) == "oauth answer"
+        mock_complete.assert_not_called()
+        assert seen[0].headers["Authorization"] == "Bearer sk-ant-oat-test"
+        assert seen[0].headers["anthropic-beta"] == "oauth-2025-04-20"
+
+    def test_one_async_client_per_loop(self):
+        from litgraph.llm.client import _get_async_httpx_client
+
+        async def get_twice():
+            return await _get_async_httpx_client(), await _get_async_httpx_client()
+
+        a1, a2 = asyncio.run(get_twice())
+        b1, _ = asyncio.run(get_twice())
+        assert a1 is a2
+        assert a1 is not b1
+
+    def test_client_closed_when_loop_shuts_down(self):
+        from litgraph.llm.client import _get_async_httpx_client
+
+        async def get():
+            return await _get_async_httpx_client()
+
+        client = asyncio.run(get())
+        assert client.is_closed
+
+    def test_reset_closes_client_on_open_loop(self):
+        from litgraph.llm.client import _get_async_httpx_client
+
+        async def get():
+            return await _get_async_httpx_client()
+
+        loop = asyncio.new_event_loop()
+        try:
+            client = loop.run_until_complete(get())
+            assert not client.is_closed
+            reset_client()
+            assert client.is_closed
+        finally:
+            loop.close()
+
+
+class TestLiteAsyncPath:
+    def test_awaits_async_openai_without_sync_complete(self, monkeypatch):
+        monkeypatch.setenv("LITGRAPH_MODE", "lite")
+        calls = []
+
+        class FakeCompletions:
+            async def create(self, model, messages):
+                calls.append((model, messages))
+                message = SimpleNamespace(content="lite answer")
+                return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        fake = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+        with patch("litgraph.llm.client._get_async_openai_client", return_value=fake), \
+                patch("litgraph.llm.client.complete") as mock_complete:
+            assert asyncio.run(cheap_model_complete("p", "s")) == "lite answer"
+        mock_complete.assert_not_called()
+        assert calls[0][1] == [
+            {"role": "system", "content": "s"},
+            {"role": "user", "content": "p"},
+        ]
@@ -0,0 +1,71 @@
+"""Tests for the shared embedding model singleton and batched encoding."""
+
+from __future__ import annotations
+
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from litgraph.llm.embedding import embed_texts, get_embedding_model, reset_embedding_model
+
+
+class _FakeModel:
+    instances = 0
+
+    def __init__(self, name):
+        _FakeModel.instances += 1
+        self.name = name
+        self.calls = []
+
+    def encode(self, texts, **kwargs):
+        self.calls.append((list(texts), kwargs))
+        return np.ones((len(texts), 3), dtype=np.float32)
+
+
+@pytest.fixture(autouse=True)
+def fake_st(monkeypatch):
+    module = types.ModuleType("sentence_transformers")
+    module.SentenceTransformer = _FakeModel
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+    _FakeModel.instances = 0
+    reset_embedding_model()
+    yield
+    reset_embedding_model()
+
+
+class TestEmbedding:
+    def test_model_loaded_once(self):
+        assert get_embedding_model("m") is get_embedding_model("m")
+        assert _FakeModel.instances == 1
+
+    def test_single_batched_encode(self):
+        texts = [f"t{i}" for i in range(100)]
+        emb = embed_texts(texts, "m", batch_size=64)
+        model = get_embedding_model("m")
+        assert emb.shape == (100, 3)
+        assert len(model.calls) == 1
+        assert model.calls[0][1]["batch_size"] == 64
+        assert model.calls[0][1]["normalize_embeddings"] is True
+
+    def test_concurrent_encodes_serialized(self):
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        active = []
+        overlap = threading.Event()
+
+        def encode(texts, **kwargs):
+            active.append(1)
+            if len(active) > 1:
+                overlap.set()
+            time.sleep(0.01)
+            active.pop()
+            return np.ones((len(texts), 3), dtype=np.float32)
+
+        get_embedding_model("m").encode = encode
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda i: embed_texts([f"t{i}"], "m"), range(8)))
+        assert not overlap.is_set()
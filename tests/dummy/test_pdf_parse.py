@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import importlib.util
+
+import httpx
 import pytest
 
+import litgraph.analysis.paper as paper_mod
 from litgraph.analysis.paper import cleanup_pdf_text, extract_pdf_text
 
+# Extraction needs pymupdf; the cleanup tests below do not
+requires_pymupdf = pytest.mark.skipif(
+    importlib.util.find_spec("pymupdf") is None, reason="pymupdf not installed"
+)
+
 
+@requires_pymupdf
 class TestExtractPdfText:
     def test_extracts_text(self, fixture_pdf):
         text = extract_pdf_text(fixture_pdf)
@@ -24,28 +34,56 @@ class TestExtractPdfText:
         text = extract_pdf_text(fixture_pdf)
         assert isinstance(text, str)
 
+    def test_from_bytes(self, fixture_pdf):
+        assert extract_pdf_text(fixture_pdf.read_bytes()) == extract_pdf_text(fixture_pdf)
 
-class TestCleanupPdfText:
-    def test_merge_hyphenated_breaks(self):
-        text = "This discusses founda-\ntion models."
-        cleaned = cleanup_pdf_text(text)
-        assert "foundation" in cleaned
 
-    def test_page_number_removal(self):
-        text = "Some content.\n\n  42  \n\nMore content."
-        cleaned = cleanup_pdf_text(text)
-        assert "42" not in cleaned
+@requires_pymupdf
+class TestDownloadAndExtractPdf:
+    @pytest.fixture
+    def serve(self, monkeypatch):
+        def _serve(data: bytes, status: int = 200):
+            transport = httpx.MockTransport(lambda request: httpx.Response(status, content=data))
+            monkeypatch.setattr(paper_mod, "_http_client", httpx.Client(transport=transport))
+        yield _serve
+        paper_mod.reset_http_client()
 
-    def test_collapse_blank_lines(self):
-        text = "Line 1\n\n\n\n\nLine 2"
-        cleaned = cleanup_pdf_text(text)
-        assert "\n\n\n" not in cleaned
+    def test_extracts_from_memory(self, serve, fixture_pdf):
+        serve(fixture_pdf.read_bytes())
+        text = paper_mod._download_and_extract_pdf("http://example.org/x.pdf")
+        assert "first page" in text
+
+    def test_oversized_pdf_skipped(self, serve, fixture_pdf, monkeypatch):
+        monkeypatch.setattr(paper_mod, "_MAX_PDF_BYTES", 16)
+        serve(fixture_pdf.read_bytes())
+        assert paper_mod._download_and_extract_pdf("http://example.org/x.pdf") is None
+
+    def test_http_error_returns_none(self, serve):
+        serve(b"not found", status=404)
+        assert paper_mod._download_and_extract_pdf("http://example.org/x.pdf") is None
 
-    def test_preserves_normal_content(self):
-        text = "This is normal text.\nWith line breaks.\n\nAnd paragraphs."
+
+class TestCleanupPdfText:
+    @pytest.mark.parametrize(
+        "text,present,absent",
+        [
+            pytest.param("This discusses founda-\ntion models.", ["foundation"], [], id="merge_hyphenated_breaks"),
+            pytest.param("Some content.\n\n  42  \n\nMore content.", [], ["42"], id="page_number_removal"),
+            pytest.param("Line 1\n\n\n\n\nLine 2", [], ["\n\n\n"], id="collapse_blank_lines"),
+            pytest.param(
+                "This is normal text.\nWith line breaks.\n\nAnd paragraphs.",
+                ["normal text", "paragraphs"],
+                [],
+                id="preserves_normal_content",
+            ),
+        ],
+    )
+    def test_cleanup(self, text, present, absent):
         cleaned = cleanup_pdf_text(text)
-        assert "normal text" in cleaned
-        assert "paragraphs" in cleaned
+        for needle in present:
+            assert needle in cleaned
+        for needle in absent:
+            assert needle not in cleaned
 
     def test_strip_whitespace(self):
         text = "\n\n  Some content  \n\n"
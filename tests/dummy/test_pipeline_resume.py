@@ -8,15 +8,10 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from litgraph.settings import reset_settings
-
 
 @pytest.fixture(autouse=True)
-def _clean(monkeypatch):
-    reset_settings()
+def _env(monkeypatch):
     monkeypatch.setenv("LITGRAPH_MODE", "pro")
-    yield
-    reset_settings()
 
 
 @pytest.fixture
@@ -87,6 +82,16 @@ class TestPipelineResume:
         pending = _resolve_papers(None, True, data_dir)
         assert len(pending) == 2
 
+    def test_missing_analysis_dir_all_pending(self, tmp_path):
+        """Without an analysis directory every indexed paper is pending."""
+        index_path = tmp_path / "papers" / "index.json"
+        index_path.parent.mkdir(parents=True)
+        index_path.write_text(json.dumps([{"paper_id": "arxiv:test1", "title": "Test 1"}]))
+        (tmp_path / "analysis.md").write_text("x")
+
+        from litgraph.analysis.batch import _resolve_papers
+        assert len(_resolve_papers(None, True, tmp_path)) == 1
+
     def test_run_record_saved(self, data_dir):
         """Pipeline run record should be saved to DATA/runs/."""
         runs_dir = data_dir / "runs"
@@ -12,16 +12,10 @@ from litgraph.llm.prompts import (
     format_questions_block,
     get_questions_version,
     load_prompt_from_path,
+    load_prompt_yaml,
     load_questions,
+    reset_prompt_cache,
 )
-from litgraph.settings import reset_settings
-
-
-@pytest.fixture(autouse=True)
-def _clean_settings():
-    reset_settings()
-    yield
-    reset_settings()
 
 
 @pytest.fixture
@@ -135,6 +129,62 @@ class TestGetQuestionsVersion:
         assert get_questions_version(questions_path=path) == 1
 
 
+class TestYamlCache:
+    def test_template_compiled_once(self, prompt_yaml):
+        from litgraph.llm import prompts
+
+        prompts._compile_template.cache_clear()
+        load_prompt_from_path(prompt_yaml, title="A", abstract="a")
+        load_prompt_from_path(prompt_yaml, title="B", abstract="b")
+        info = prompts._compile_template.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_template_edit_recompiled(self, prompt_yaml):
+        data = yaml.safe_load(prompt_yaml.read_text())
+        load_prompt_from_path(prompt_yaml, title="A", abstract="a")
+        data["template"] = "New: {{ title }}"
+        prompt_yaml.write_text(yaml.dump(data))
+        _, user = load_prompt_from_path(prompt_yaml, title="A", abstract="a")
+        assert user == "New: A"
+
+    def test_reparsed_after_edit(self, questions_yaml):
+        assert get_questions_version(questions_path=questions_yaml) == 1
+        data = yaml.safe_load(questions_yaml.read_text())
+        data["version"] = 2
+        questions_yaml.write_text(yaml.dump(data))
+        assert get_questions_version(questions_path=questions_yaml) == 2
+
+    def test_parsed_once_while_unchanged(self, questions_yaml, monkeypatch):
+        calls = []
+        real = yaml.load
+        monkeypatch.setattr(yaml, "load", lambda s, Loader: calls.append(1) or real(s, Loader=Loader))
+        load_questions(questions_path=questions_yaml)
+        load_questions(questions_path=questions_yaml)
+        get_questions_version(questions_path=questions_yaml)
+        assert len(calls) == 1
+
+    def test_load_prompt_yaml(self, prompt_yaml):
+        data = load_prompt_yaml(prompt_yaml)
+        assert data["system"] == "You are a test assistant."
+        assert load_prompt_yaml(prompt_yaml) is data
+
+    def test_returned_list_not_shared(self, questions_yaml):
+        load_questions(questions_path=questions_yaml).clear()
+        assert len(load_questions(questions_path=questions_yaml)) == 6
+
+    def test_returned_questions_not_shared(self, questions_yaml):
+        load_questions(questions_path=questions_yaml)[0]["text"] = "changed"
+        assert load_questions(questions_path=questions_yaml)[0]["text"] == "What problem does this paper address?"
+
+    def test_reset_prompt_cache(self, prompt_yaml):
+        from litgraph.llm import prompts
+
+        load_prompt_from_path(prompt_yaml, title="A", abstract="a")
+        reset_prompt_cache()
+        assert prompts._yaml_cache == {}
+        assert prompts._compile_template.cache_info().currsize == 0
+
+
 class TestFormatQuestionsBlock:
     def test_format(self):
         questions = [
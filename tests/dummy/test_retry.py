@@ -0,0 +1,122 @@
+"""Tests for the retry decorator's jittered backoff (sleep is mocked)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from litgraph.retry import with_retry
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch):
+    monkeypatch.setenv("LITGRAPH_MODE", "pro")
+    monkeypatch.setenv("LITGRAPH_MAX_RETRIES", "6")
+    monkeypatch.setenv("LITGRAPH_RETRY_BACKOFF_BASE", "2.0")
+    monkeypatch.setenv("LITGRAPH_RETRY_BACKOFF_CAP", "10.0")
+
+
+def _flaky(failures: int):
+    calls = []
+
+    def func():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise RuntimeError("boom")
+        return "ok"
+
+    return func, calls
+
+
+class TestWithRetry:
+    @patch("litgraph.retry.time.sleep")
+    def test_sync_waits_are_jittered_and_capped(self, mock_sleep):
+        func, calls = _flaky(6)
+        assert with_retry(func)() == "ok"
+        assert len(calls) == 7
+        waits = [c.args[0] for c in mock_sleep.call_args_list]
+        for attempt, wait in enumerate(waits):
+            assert 0 <= wait <= min(10.0, 2.0 ** attempt)
+
+    @patch("litgraph.retry.time.sleep")
+    def test_raises_after_max_retries(self, mock_sleep):
+        func, calls = _flaky(100)
+        with pytest.raises(RuntimeError, match="boom"):
+            with_retry(func)()
+        assert len(calls) == 7
+        assert mock_sleep.call_count == 6
+
+    @patch("litgraph.retry.random.Random.uniform", side_effect=lambda a, b: b)
+    def test_async_waits_capped(self, mock_uniform):
+        waits = []
+        failures = []
+
+        async def fake_sleep(seconds):
+            waits.append(seconds)
+
+        @with_retry
+        async def func():
+            failures.append(1)
+            if len(failures) <= 6:
+                raise RuntimeError("boom")
+            return "ok"
+
+        with patch("litgraph.retry.asyncio.sleep", fake_sleep):
+            assert asyncio.run(func()) == "ok"
+        assert waits == [1.0, 2.0, 4.0, 8.0, 10.0, 10.0]
+
+
+class TestRateLimiter:
+    def test_window_enforced_across_threads(self):
+        import threading
+
+        from litgraph.retry import RateLimiter
+
+        limiter = RateLimiter(max_calls=5, period=3600)
+        results = []
+        barrier = threading.Barrier(20)
+
+        def worker():
+            barrier.wait()
+            results.append(limiter._try_acquire())
+
+        threads = [threading.Thread(target=worker) for _ in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results.count(None) == 5
+        assert all(w > 0 for w in results if w is not None)
+
+    def test_async_acquire_waits_for_window(self):
+        from litgraph.retry import RateLimiter
+
+        limiter = RateLimiter(max_calls=2, period=0.2)
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+            return loop.time() - start
+
+        assert asyncio.run(run()) >= 0.15
+
+
+class TestWithRetrySettings:
+    def test_success_does_not_read_settings(self):
+        with patch("litgraph.settings.get_settings") as mock_get:
+            assert with_retry(lambda: "ok")() == "ok"
+        mock_get.assert_not_called()
+
+    @patch("litgraph.retry.time.sleep")
+    def test_settings_reload_applies_to_next_call(self, mock_sleep, monkeypatch):
+        from litgraph.settings import get_settings
+
+        wrapped = with_retry(_flaky(100)[0])
+        monkeypatch.setenv("LITGRAPH_MAX_RETRIES", "1")
+        get_settings(force_reload=True)
+        with pytest.raises(RuntimeError):
+            wrapped()
+        assert mock_sleep.call_count == 1
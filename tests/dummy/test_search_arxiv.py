@@ -0,0 +1,52 @@
+"""Tests for parsing paperscraper arxiv dumps (no network)."""
+
+from __future__ import annotations
+
+from litgraph.search.arxiv import _read_arxiv_jsonl
+
+
+class TestReadArxivJsonl:
+    def test_parses_and_normalizes(self, tmp_path):
+        path = tmp_path / "kw.jsonl"
+        path.write_bytes(
+            b'{"title": " Paper A ", "doi": "10.48550/arXiv.2401.00001", "date": "2024-01-02"}\n'
+            b"\n"
+            b"not json\n"
+            b'{"title": ""}\n'
+            b'{"title": "Paper B", "arxiv_id": "2402.00002", "abstract": "\xc3\xbc"}\r\n'
+        )
+        papers = _read_arxiv_jsonl(path)
+        assert [p["title"] for p in papers] == ["Paper A", "Paper B"]
+        assert papers[0]["arxiv_id"] == "arXiv.2401.00001"
+        assert papers[0]["year"] == "2024"
+        assert papers[1]["abstract"] == "ü"
+
+    def test_missing_file(self, tmp_path):
+        assert _read_arxiv_jsonl(tmp_path / "missing.jsonl") == []
+
+
+class TestSearchArxivBudget:
+    def test_passes_remaining_budget_and_stops(self, monkeypatch):
+        import json
+        import sys
+        import types
+
+        from litgraph.search.arxiv import search_arxiv
+
+        requested = []
+
+        def fake_dump(kw, output_filepath, max_results):
+            requested.append((kw, max_results))
+            with open(output_filepath, "w") as f:
+                for i in range(3):
+                    f.write(json.dumps({"title": f"{kw} {i}", "arxiv_id": f"{kw}.{i}"}) + "\n")
+
+        fake_pkg = types.ModuleType("paperscraper")
+        fake_mod = types.ModuleType("paperscraper.arxiv")
+        fake_mod.get_and_dump_arxiv_papers = fake_dump
+        monkeypatch.setitem(sys.modules, "paperscraper", fake_pkg)
+        monkeypatch.setitem(sys.modules, "paperscraper.arxiv", fake_mod)
+
+        papers = search_arxiv(["a", "b", "c"], max_results=5)
+        assert [p["title"] for p in papers] == ["a 0", "a 1", "a 2", "b 0", "b 1"]
+        assert requested == [("a", 5), ("b", 2)]
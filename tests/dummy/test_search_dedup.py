@@ -10,7 +10,9 @@ from litgraph.search.dedup import (
     _title_hash,
     dedup_key,
     dedup_paper_list,
+    load_index,
     merge_into_index,
+    save_index,
 )
 
 
@@ -67,6 +69,20 @@ class TestTitleHash:
         """Different titles should produce different hashes."""
         assert _title_hash("Paper A") != _title_hash("Paper B")
 
+    @pytest.mark.parametrize("title", [
+        "scGPT: Towards Building a Foundation Model",
+        "snake_case\tand\x1ccontrol\x00chars",
+        "  Über-große  Modelle — eine Übersicht ",
+        "",
+    ])
+    def test_matches_regex_normalization(self, title):
+        """Keys stored in existing indexes must not change."""
+        import hashlib
+        import re
+
+        t = re.sub(r"\s+", " ", re.sub(r"[^\w\s]", "", title.lower())).strip()
+        assert _title_hash(title) == hashlib.sha256(t.encode("utf-8")).hexdigest()[:16]
+
 
 class TestDedupPaperList:
     def test_basic_dedup(self, fixture_papers):
@@ -121,6 +137,26 @@ class TestMergeIntoIndex:
             data = json.load(f)
         assert len(data) == 3
 
+    def test_unchanged_index_not_rewritten(self, data_dir, fixture_papers):
+        """A merge that adds and updates nothing leaves index.json untouched."""
+        from unittest.mock import patch
+
+        index_path = data_dir / "papers" / "index.json"
+        merge_into_index(fixture_papers, index_path)
+        with patch("litgraph.search.dedup.save_index") as mock_save:
+            assert merge_into_index(fixture_papers, index_path) == ([], [])
+        mock_save.assert_not_called()
+
+    def test_stored_keys_not_recomputed(self, data_dir, fixture_papers):
+        """Index entries and papers that already carry a dedup_key are not re-keyed."""
+        from unittest.mock import patch
+
+        index_path = data_dir / "papers" / "index.json"
+        merge_into_index(fixture_papers, index_path)
+        with patch("litgraph.search.dedup.dedup_key") as mock_key:
+            merge_into_index(fixture_papers, index_path)
+        mock_key.assert_not_called()
+
     def test_update_meta_fields(self, data_dir, fixture_papers):
         """Updated meta fields (citations, doi, pdf_url) should be refreshed."""
         index_path = data_dir / "papers" / "index.json"
@@ -153,3 +189,19 @@ class TestMergeIntoIndex:
         added, updated = merge_into_index([], index_path)
         assert len(added) == 0
         assert len(updated) == 0
+
+
+class TestIndexIO:
+    def test_roundtrip_json_compatible(self, data_dir, fixture_papers):
+        index_path = data_dir / "papers" / "index.json"
+        papers = fixture_papers + [{"title": "Über Zellen — 単一細胞", "authors": ["Zoë"]}]
+        save_index(papers, index_path)
+        assert load_index(index_path) == papers
+        with open(index_path, encoding="utf-8") as f:
+            assert json.load(f) == papers
+        assert "Zoë" in index_path.read_text(encoding="utf-8")
+
+    def test_no_temp_files_left(self, data_dir, fixture_papers):
+        index_path = data_dir / "papers" / "index.json"
+        save_index(fixture_papers, index_path)
+        assert [p.name for p in index_path.parent.iterdir()] == ["index.json"]
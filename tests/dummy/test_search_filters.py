@@ -0,0 +1,64 @@
+"""Tests for paper filtering (LLM calls are mocked)."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from litgraph.llm.prompts import load_prompt_from_path
+from litgraph.search.filters import filter_papers
+
+_BATCH_PROMPT = Path(__file__).parents[2] / "config" / "prompts" / "relevance_filter_batch.yaml"
+
+
+def _papers(n):
+    return [{"title": f"Paper {i}", "abstract": f"Abstract {i}", "citations": i} for i in range(n)]
+
+
+def _fake_load_prompt(name, **kwargs):
+    return name, json.dumps(kwargs)
+
+
+class TestFilterPapers:
+    def test_citation_threshold(self):
+        result = filter_papers(_papers(5), min_citations=3)
+        assert [p["title"] for p in result] == ["Paper 3", "Paper 4"]
+        assert all(p["relevant"] for p in result)
+
+    @patch("litgraph.llm.prompts.load_prompt", side_effect=_fake_load_prompt)
+    @patch("litgraph.llm.client.complete")
+    def test_llm_filter_batches_papers(self, mock_complete, mock_prompt):
+        def answer(user, system_prompt, model):
+            papers = json.loads(user)["papers"]
+            return json.dumps({"relevant": [int(p["title"].split()[1]) % 2 == 0 for p in papers]})
+
+        mock_complete.side_effect = answer
+        result = filter_papers(_papers(25), keywords=["x"], use_llm_filter=True)
+        assert [p["title"] for p in result] == [f"Paper {i}" for i in range(0, 25, 2)]
+        assert mock_complete.call_count == 3
+
+    @patch("litgraph.llm.prompts.load_prompt", side_effect=_fake_load_prompt)
+    @patch("litgraph.llm.client.complete")
+    def test_bad_batch_answer_falls_back_per_paper(self, mock_complete, mock_prompt):
+        mock_complete.side_effect = ['{"relevant": [true]}', '{"relevant": false}', '{"relevant": true}']
+        result = filter_papers(_papers(2), keywords=["x"], use_llm_filter=True)
+        assert [p["title"] for p in result] == ["Paper 1"]
+        assert mock_prompt.call_args_list[0].args[0] == "relevance_filter_batch"
+        assert mock_prompt.call_args_list[1].args[0] == "relevance_filter"
+
+    @patch("litgraph.llm.prompts.load_prompt", side_effect=_fake_load_prompt)
+    @patch("litgraph.llm.client.complete")
+    def test_non_boolean_flags_fall_back_per_paper(self, mock_complete, mock_prompt):
+        mock_complete.side_effect = ['{"relevant": ["false", "true"]}', '{"relevant": false}', '{"relevant": true}']
+        result = filter_papers(_papers(2), keywords=["x"], use_llm_filter=True)
+        assert [p["title"] for p in result] == ["Paper 1"]
+        assert mock_complete.call_count == 3
+
+
+class TestBatchPrompt:
+    def test_renders_numbered_papers(self):
+        _, user = load_prompt_from_path(_BATCH_PROMPT, topic="t", papers=_papers(2))
+        assert "1. Title: Paper 0" in user
+        assert "2. Title: Paper 1" in user
+        assert "Abstract: Abstract 1" in user
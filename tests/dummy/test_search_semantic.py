@@ -0,0 +1,79 @@
+"""Tests for Semantic Scholar search budgeting (client is faked, no network)."""
+
+from __future__ import annotations
+
+import sys
+import types
+from types import SimpleNamespace
+
+import pytest
+
+from litgraph.search import semantic
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch):
+    monkeypatch.setenv("LITGRAPH_MODE", "pro")
+    monkeypatch.setattr(semantic, "_rate_limiter", None)
+    monkeypatch.setattr(semantic, "_client", None)
+
+
+class FakeResults:
+    """Stands in for PaginatedResults: each consumed page past the first is a request."""
+
+    def __init__(self, kw, pages, log):
+        self.kw, self.pages, self.log = kw, pages, log
+
+    def __iter__(self):
+        for page in range(self.pages):
+            self.log.append((self.kw, page))
+            for i in range(10):
+                yield SimpleNamespace(title=f"{self.kw} {page}.{i}", externalIds={}, authors=[])
+
+
+def test_stops_fetching_once_budget_is_filled(monkeypatch):
+    log, limits = [], []
+
+    class FakeSemanticScholar:
+        def search_paper(self, kw, limit, year, fields):
+            limits.append(limit)
+            return FakeResults(kw, pages=5, log=log)
+
+    fake_mod = types.ModuleType("semanticscholar")
+    fake_mod.SemanticScholar = FakeSemanticScholar
+    monkeypatch.setitem(sys.modules, "semanticscholar", fake_mod)
+
+    papers = semantic.search_semantic_scholar(["a", "b"], max_results=15)
+    sch = semantic._client
+    assert len(papers) == 15
+    assert log == [("a", 0), ("a", 1)]
+    assert limits == [15]
+
+    semantic.search_semantic_scholar(["c"], max_results=1)
+    assert semantic._client is sch
+
+
+class TestNormalize:
+    def test_full_item(self):
+        item = SimpleNamespace(
+            title=" T ", abstract=None, year=2024, citationCount=None,
+            externalIds={"ArXiv": "2401.1", "DOI": "10.1/x"},
+            authors=[SimpleNamespace(name="A"), {"name": "B"}],
+            openAccessPdf={"url": "http://pdf"},
+        )
+        paper = semantic._normalize_ss_paper(item)
+        assert paper["title"] == "T"
+        assert paper["paper_id"] == "arxiv:2401.1"
+        assert paper["authors"] == ["A", "B"]
+        assert paper["abstract"] == ""
+        assert paper["citations"] == 0
+        assert paper["pdf_url"] == "http://pdf"
+
+    def test_partial_item(self):
+        paper = semantic._normalize_ss_paper(SimpleNamespace(title="T", externalIds={"DOI": "10.1/x"}))
+        assert paper["paper_id"] == "doi:10.1/x"
+        assert paper["year"] is None
+        assert paper["authors"] == []
+
+    def test_missing_title(self):
+        assert semantic._normalize_ss_paper(SimpleNamespace(title="  ")) is None
@@ -14,18 +14,9 @@ from litgraph.settings import (
     Settings,
     _resolve_data_dir,
     get_settings,
-    reset_settings,
 )
 
 
-@pytest.fixture(autouse=True)
-def _clean_settings():
-    """Reset singleton before and after each test."""
-    reset_settings()
-    yield
-    reset_settings()
-
-
 @pytest.fixture
 def project_root(tmp_path):
     """Create a minimal project structure for settings loading."""
@@ -130,6 +121,21 @@ class TestModeSwitch:
         settings = get_settings(project_root=project_root)
         assert settings.llm.base_url == "http://myhost:11434/v1"
 
+    def test_mode_argument_overrides_env(self, project_root, monkeypatch):
+        monkeypatch.setenv("LITGRAPH_MODE", "pro")
+        monkeypatch.setenv("LITGRAPH_OLLAMA_MODEL", "qwen2.5:7b")
+
+        settings = get_settings(project_root=project_root, mode="lite")
+        assert settings.mode == "lite"
+        assert settings.llm.best_model == "qwen2.5:7b"
+        assert os.environ["LITGRAPH_MODE"] == "pro"
+
+    def test_mode_argument_rebuilds_mismatched_singleton(self, project_root, monkeypatch):
+        monkeypatch.setenv("LITGRAPH_MODE", "pro")
+        s1 = get_settings(project_root=project_root)
+        assert get_settings(project_root=project_root, mode="pro") is s1
+        assert get_settings(project_root=project_root, mode="lite").mode == "lite"
+
 
 class TestRetryAndRateLimit:
     def test_default_retry(self, project_root, monkeypatch):
@@ -183,6 +189,48 @@ class TestSingleton:
         assert s2.mode == "lite"
         assert s1 is not s2
 
+    def test_force_reload_reuses_unchanged_defaults(self, project_root, monkeypatch):
+        import yaml
+
+        monkeypatch.delenv("LITGRAPH_DATA_DIR", raising=False)
+        calls = []
+        real = yaml.load
+        monkeypatch.setattr(yaml, "load", lambda f, Loader: calls.append(1) or real(f, Loader=Loader))
+        get_settings(project_root=project_root, force_reload=True)
+        get_settings(project_root=project_root, force_reload=True)
+        assert len(calls) == 1
+
+        cfg = project_root / "config" / "config.default.yaml"
+        cfg.write_text("data_dir: /tmp/litgraph-other-data\n")
+        os.utime(cfg, ns=(0, 10**9))
+        assert get_settings(project_root=project_root, force_reload=True).data_dir == Path(
+            "/tmp/litgraph-other-data"
+        )
+
+    def test_force_reload_reuses_unchanged_env_file(self, project_root, monkeypatch):
+        import litgraph.settings as settings_mod
+
+        monkeypatch.setenv("LITGRAPH_OLLAMA_MODEL", "unset")
+        (project_root / ".env").write_text("LITGRAPH_OLLAMA_MODEL=llama3.1:8b\n")
+        calls = []
+        real = settings_mod.dotenv_values
+        monkeypatch.setattr(settings_mod, "dotenv_values", lambda *a, **kw: calls.append(1) or real(*a, **kw))
+        get_settings(project_root=project_root, force_reload=True, mode="lite")
+        monkeypatch.setenv("LITGRAPH_OLLAMA_MODEL", "changed-in-between")
+        s = get_settings(project_root=project_root, force_reload=True, mode="lite")
+        assert len(calls) == 1
+        # The cached values are still applied over the environment on each load
+        assert s.llm.best_model == "llama3.1:8b"
+
+    def test_env_file_interpolation_not_cached(self, project_root, monkeypatch):
+        monkeypatch.setenv("LITGRAPH_OLLAMA_MODEL", "unset")
+        monkeypatch.setenv("BASE_MODEL", "qwen")
+        (project_root / ".env").write_text("LITGRAPH_OLLAMA_MODEL=${BASE_MODEL}:7b\n")
+        assert get_settings(project_root=project_root, mode="lite").llm.best_model == "qwen:7b"
+        monkeypatch.setenv("BASE_MODEL", "llama")
+        s = get_settings(project_root=project_root, force_reload=True, mode="lite")
+        assert s.llm.best_model == "llama:7b"
+
 
 class TestConfigPaths:
     def test_prompts_dir(self, project_root, monkeypatch):
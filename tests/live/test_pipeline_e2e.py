@@ -5,6 +5,7 @@ from __future__ import annotations
 import pytest
 from click.testing import CliRunner
 
+from litgraph.cli import main
 from litgraph.settings import reset_settings
 
 
@@ -21,8 +22,6 @@ def test_pipeline_e2e(monkeypatch, tmp_path):
     monkeypatch.setenv("LITGRAPH_MODE", "lite")
     monkeypatch.setenv("LITGRAPH_DATA_DIR", str(tmp_path))
 
-    from litgraph.cli import main
-
     runner = CliRunner()
     result = runner.invoke(main, [
         "run",